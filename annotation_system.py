@@ -6,7 +6,7 @@ from typing import List, Optional, Callable
 from PyQt6.QtWidgets import QMessageBox, QWidget
 
 from EEG_Annotation_Desktop__Application.models import Annotation, AnnotationCollection, SelectionState
-from EEG_Annotation_Desktop__Application.ui_components import AnnotationDialog
+from EEG_Annotation_Desktop__Application.ui_components import get_annotation_dialog
 
 
 class AnnotationManager:
@@ -95,7 +95,7 @@ class AnnotationManager:
 
     def _prompt_for_annotation(self):
         """Open a dialog to get annotation text and add the annotation."""
-        dialog = AnnotationDialog(self.parent_widget, self.predefined_annotations)
+        dialog = get_annotation_dialog(self.parent_widget, self.predefined_annotations)
         
         # Check if it's a punctual event and set default
         if self.selection_state.duration < 0.01:
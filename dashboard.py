@@ -10,6 +10,16 @@ from datetime import datetime
 import mne
 # Just to test the git push
 
+# Standard EEG channel names (10-20 system), upper-cased for case-insensitive matching
+STANDARD_EEG_CHANNELS = frozenset({
+    'FP1', 'FP2', 'F3', 'F4', 'C3', 'C4', 'P3', 'P4', 'O1', 'O2',
+    'F7', 'F8', 'T3', 'T4', 'T5', 'T6', 'FZ', 'CZ', 'PZ',
+    'T7', 'T8', 'P7', 'P8', 'FC1', 'FC2', 'CP1', 'CP2'
+})
+
+# Check column glyphs in the channel window, indexed by the 0/1 checked state
+CHECK_GLYPHS = ('\u2610', '\u2611')
+
 class eegDashboard:
     def __init__(self, rootWindow):
         self.rootWindow = rootWindow
@@ -40,6 +50,18 @@ class eegDashboard:
         self.selectionRectangle = None
         self.mousePressed = False
 
+        # Pending Tk after() ids for debounced control changes, keyed by control
+        self.pendingCallbacks = {}
+
+        # Channel settings window, kept hidden between opens for the same channel list
+        self.channelWindow = None
+        self.channelWindowNames = None
+        self.channelChecked = bytearray()  # one byte per channel, 1 = checked
+        self.refreshChannelRows = None
+
+        # Text last written to the current-annotations box, so unchanged content is not rewritten
+        self.shownAnnotationsText = None
+
         self.setupUserInterface()
 
     def setupUserInterface(self):
@@ -69,7 +91,8 @@ class eegDashboard:
         timeScaleCombo = ttk.Combobox(scaleFrame, textvariable=self.timeScaleVar,
                                       values=["5", "10", "20", "30", "60"], width=8)
         timeScaleCombo.grid(row=0, column=1, padx=2)
-        timeScaleCombo.bind('<<ComboboxSelected>>', self.onTimeScaleChange)
+        timeScaleCombo.bind('<<ComboboxSelected>>',
+                            lambda event: self.scheduleDebounced('timeScale', self.onTimeScaleChange))
 
         # Amplitude scale
         ttk.Label(scaleFrame, text="Amplitude:").grid(row=0, column=2, sticky=tk.W, padx=(10, 2))
@@ -78,7 +101,8 @@ class eegDashboard:
                                            values=["0.1", "0.2", "0.5", "1.0", "2.0", "5.0", "10.0", "20.0", "50.0"],
                                            width=8)
         amplitudeScaleCombo.grid(row=0, column=3, padx=2)
-        amplitudeScaleCombo.bind('<<ComboboxSelected>>', self.onAmplitudeScaleChange)
+        amplitudeScaleCombo.bind('<<ComboboxSelected>>',
+                                 lambda event: self.scheduleDebounced('amplitude', self.onAmplitudeScaleChange))
 
         # Filter controls
         ttk.Label(scaleFrame, text="LP Filter (Hz):").grid(row=1, column=0, sticky=tk.W, padx=2)
@@ -86,14 +110,16 @@ class eegDashboard:
         lowpassCombo = ttk.Combobox(scaleFrame, textvariable=self.lowpassVar,
                                     values=["None", "30", "50", "70", "100"], width=8)
         lowpassCombo.grid(row=1, column=1, padx=2)
-        lowpassCombo.bind('<<ComboboxSelected>>', self.onFilterChange)
+        lowpassCombo.bind('<<ComboboxSelected>>',
+                          lambda event: self.scheduleDebounced('filter', self.onFilterChange))
 
         ttk.Label(scaleFrame, text="HP Filter (Hz):").grid(row=1, column=2, sticky=tk.W, padx=(10, 2))
         self.highpassVar = tk.StringVar(value="None")
         highpassCombo = ttk.Combobox(scaleFrame, textvariable=self.highpassVar,
                                      values=["None", "0.1", "0.5", "1.0", "5.0"], width=8)
         highpassCombo.grid(row=1, column=3, padx=2)
-        highpassCombo.bind('<<ComboboxSelected>>', self.onFilterChange)
+        highpassCombo.bind('<<ComboboxSelected>>',
+                           lambda event: self.scheduleDebounced('filter', self.onFilterChange))
 
         # Navigation buttons
         navFrame = ttk.Frame(controlFrame)
@@ -107,6 +133,9 @@ class eegDashboard:
         # Window position label
         self.windowInfoLabel = ttk.Label(controlFrame, text="No file loaded")
         self.windowInfoLabel.pack(side=tk.LEFT, padx=(0, 10))
+        # Tcl command prefix for setting the label text; updateWindowInfo runs on every
+        # navigation step and calling it directly skips tkinter's config() option handling
+        self.windowInfoTextCommand = (self.windowInfoLabel._w, 'configure', '-text')
 
         # Annotation controls
         annotationFrame = ttk.Frame(mainFrame)
@@ -152,7 +181,8 @@ class eegDashboard:
         annotationDisplayFrame.pack(fill=tk.X, pady=(10, 0))
 
         ttk.Label(annotationDisplayFrame, text="Current Window Annotations:").pack(anchor=tk.W)
-        self.currentAnnotationsText = tk.Text(annotationDisplayFrame, height=4)
+        # Read-only, so its contents always match shownAnnotationsText
+        self.currentAnnotationsText = tk.Text(annotationDisplayFrame, height=4, state=tk.DISABLED)
         self.currentAnnotationsText.pack(fill=tk.X)
 
     def openChannelSettings(self):
@@ -161,10 +191,24 @@ class eegDashboard:
             messagebox.showwarning("Warning", "Please load an EEG file first")
             return
 
+        # Reuse the window built for this channel list; only the checkbox states need syncing
+        if self.channelWindow is not None and self.channelWindow.winfo_exists():
+            if self.channelWindowNames == self.channelNames:
+                self.channelChecked[:] = self.currentChannelMask()
+                self.refreshChannelRows()
+                self.channelWindow.deiconify()
+                self.channelWindow.grab_set()
+                return
+        self.destroyChannelWindow()
+
         # Create channel selection window
         channelWindow = tk.Toplevel(self.rootWindow)
         channelWindow.title("Channel Selection Settings")
-        channelWindow.geometry("400x500")
+        # Centered from the known size, so no idle-task flush is needed to measure the window
+        windowWidth, windowHeight = 400, 500
+        x = (channelWindow.winfo_screenwidth() - windowWidth) // 2
+        y = (channelWindow.winfo_screenheight() - windowHeight) // 2
+        channelWindow.geometry(f"{windowWidth}x{windowHeight}+{x}+{y}")
         channelWindow.resizable(True, True)
 
         # Make window modal
@@ -184,52 +228,64 @@ class eegDashboard:
         buttonFrame.pack(fill=tk.X, pady=(0, 10))
 
         ttk.Button(buttonFrame, text="Select All",
-                   command=lambda: self.selectAllChannels(channelVars)).pack(side=tk.LEFT, padx=(0, 5))
+                   command=self.selectAllChannels).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(buttonFrame, text="Deselect All",
-                   command=lambda: self.deselectAllChannels(channelVars)).pack(side=tk.LEFT, padx=(0, 5))
+                   command=self.deselectAllChannels).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(buttonFrame, text="Select Standard EEG",
-                   command=lambda: self.selectStandardEegChannels(channelVars)).pack(side=tk.LEFT)
+                   command=self.selectStandardEegChannels).pack(side=tk.LEFT)
 
-        # Create scrollable frame for channel checkboxes
+        # Create scrollable list of channels
         channelFrame = ttk.Frame(mainFrame)
         channelFrame.pack(fill=tk.BOTH, expand=True)
 
-        # Create canvas and scrollbar for scrollable area
-        canvas = tk.Canvas(channelFrame, height=300)
-        scrollbar = ttk.Scrollbar(channelFrame, orient="vertical", command=canvas.yview)
-        scrollableFrame = ttk.Frame(canvas)
-
-        scrollableFrame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollableFrame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Create channel variables and checkboxes
-        channelVars = []
+        # Checked states live in a plain bytearray rather than one Tcl variable per channel,
+        # so Apply and the select buttons never round-trip to Tcl per channel
+        self.channelChecked = self.currentChannelMask()
+
+        # A Treeview draws only the rows in view and scrolls natively, so hundreds of channels
+        # stay responsive; the first column shows a check glyph toggled by clicking the row
+        scrollbar = ttk.Scrollbar(channelFrame, orient="vertical")
+        tree = ttk.Treeview(channelFrame, columns=("sel", "name"), show="headings",
+                            selectmode="none", yscrollcommand=scrollbar.set)
+        scrollbar.configure(command=tree.yview)
+        tree.heading("sel", text="")
+        tree.heading("name", text="Channel", anchor=tk.W)
+        tree.column("sel", width=30, stretch=False, anchor=tk.CENTER)
+        tree.column("name", anchor=tk.W)
+
+        # All rows go in through one Tcl foreach rather than a tree.insert call per channel
+        channelRows = []
         for i, channelName in enumerate(self.channelNames):
-            var = tk.BooleanVar()
-            # Set initial state based on current selection
-            var.set(i in self.selectedChannels if self.selectedChannels else True)
-            channelVars.append(var)
-
-            checkFrame = ttk.Frame(scrollableFrame)
-            checkFrame.pack(fill=tk.X, pady=1)
-
-            checkbox = ttk.Checkbutton(checkFrame, text=f"{i + 1:2d}. {channelName}",
-                                       variable=var, width=40)
-            checkbox.pack(anchor=tk.W)
-
-        # Enable mouse wheel scrolling
-        def onMouseWheel(event):
-            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        canvas.bind("<MouseWheel>", onMouseWheel)
+            channelRows += (i, CHECK_GLYPHS[self.channelChecked[i]], f"{i + 1:2d}. {channelName}")
+        tree.tk.call("foreach", ("row", "glyph", "name"), tuple(channelRows),
+                     f"{tree._w} insert {{}} end -id $row -values [list $glyph $name]")
+        shownChecked = bytearray(self.channelChecked)  # states the glyphs currently show
+
+        def refreshChannelRows():
+            """Redraw the check glyphs that differ from the channel mask"""
+            changedRows = []
+            for i, (checked, shown) in enumerate(zip(self.channelChecked, shownChecked)):
+                if checked != shown:
+                    changedRows += (i, CHECK_GLYPHS[checked])
+            if changedRows:
+                # One Tcl foreach sets every changed glyph, instead of a tree.set call per row
+                tree.tk.call("foreach", ("row", "glyph"), tuple(changedRows),
+                             f"{tree._w} set $row sel $glyph")
+                shownChecked[:] = self.channelChecked
+
+        def onTreeClick(event):
+            """Toggle the channel under the pointer"""
+            row = tree.identify_row(event.y)
+            if row:
+                i = int(row)
+                self.channelChecked[i] ^= 1
+                shownChecked[i] = self.channelChecked[i]
+                tree.set(row, "sel", CHECK_GLYPHS[self.channelChecked[i]])
+
+        tree.bind("<Button-1>", onTreeClick)
+
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
 
         # OK and Cancel buttons
         buttonFrame2 = ttk.Frame(mainFrame)
@@ -237,10 +293,7 @@ class eegDashboard:
 
         def applyChannelSelection():
             """Apply the selected channels"""
-            newSelectedChannels = []
-            for i, var in enumerate(channelVars):
-                if var.get():
-                    newSelectedChannels.append(i)
+            newSelectedChannels = [i for i, checked in enumerate(self.channelChecked) if checked]
 
             if not newSelectedChannels:
                 messagebox.showwarning("Warning", "Please select at least one channel")
@@ -248,46 +301,61 @@ class eegDashboard:
 
             self.selectedChannels = newSelectedChannels
             self.updatePlot()
-            channelWindow.destroy()
+            hideChannelWindow()
+
+        def hideChannelWindow():
+            """Hide the window so the next open can reuse it"""
+            channelWindow.grab_release()
+            channelWindow.withdraw()
 
         def cancelChannelSelection():
             """Cancel channel selection"""
-            channelWindow.destroy()
+            hideChannelWindow()
+
+        channelWindow.protocol("WM_DELETE_WINDOW", cancelChannelSelection)
 
         ttk.Button(buttonFrame2, text="Apply", command=applyChannelSelection).pack(side=tk.RIGHT, padx=(5, 0))
         ttk.Button(buttonFrame2, text="Cancel", command=cancelChannelSelection).pack(side=tk.RIGHT)
 
-        # Center the window
-        channelWindow.update_idletasks()
-        x = (channelWindow.winfo_screenwidth() // 2) - (channelWindow.winfo_width() // 2)
-        y = (channelWindow.winfo_screenheight() // 2) - (channelWindow.winfo_height() // 2)
-        channelWindow.geometry(f"+{x}+{y}")
+        self.channelWindow = channelWindow
+        self.channelWindowNames = list(self.channelNames)
+        self.refreshChannelRows = refreshChannelRows
+
+    def destroyChannelWindow(self):
+        """Destroy the cached channel window and drop its callbacks and variables"""
+        if self.channelWindow is not None and self.channelWindow.winfo_exists():
+            # destroy() also deletes the Tcl commands bound for the window and its children
+            self.channelWindow.grab_release()
+            self.channelWindow.destroy()
+        self.channelWindow = None
+        self.channelWindowNames = None
+        self.channelChecked = bytearray()
+        self.refreshChannelRows = None
+
+    def currentChannelMask(self):
+        """Checkbox states matching selectedChannels, one byte per channel (all on if none)"""
+        if not self.selectedChannels:
+            return bytearray(b'\x01') * len(self.channelNames)
+        mask = bytearray(len(self.channelNames))
+        for i in self.selectedChannels:
+            mask[i] = 1
+        return mask
 
-    def selectAllChannels(self, channelVars):
+    def selectAllChannels(self):
         """Select all channels"""
-        for var in channelVars:
-            var.set(True)
+        self.channelChecked[:] = b'\x01' * len(self.channelChecked)
+        self.refreshChannelRows()
 
-    def deselectAllChannels(self, channelVars):
+    def deselectAllChannels(self):
         """Deselect all channels"""
-        for var in channelVars:
-            var.set(False)
+        self.channelChecked[:] = bytes(len(self.channelChecked))
+        self.refreshChannelRows()
 
-    def selectStandardEegChannels(self, channelVars):
+    def selectStandardEegChannels(self):
         """Select standard EEG channels (10-20 system)"""
-        standardChannels = [
-            'FP1', 'FP2', 'F3', 'F4', 'C3', 'C4', 'P3', 'P4', 'O1', 'O2',
-            'F7', 'F8', 'T3', 'T4', 'T5', 'T6', 'FZ', 'CZ', 'PZ',
-            'T7', 'T8', 'P7', 'P8', 'FC1', 'FC2', 'CP1', 'CP2'
-        ]
-
-        # First deselect all
-        self.deselectAllChannels(channelVars)
-
-        # Then select standard channels if they exist
-        for i, channelName in enumerate(self.channelNames):
-            if channelName.upper() in [ch.upper() for ch in standardChannels]:
-                channelVars[i].set(True)
+        self.channelChecked[:] = bytes(channelName.upper() in STANDARD_EEG_CHANNELS
+                                       for channelName in self.channelNames)
+        self.refreshChannelRows()
 
     def getSelectedChannelData(self, data):
         """Get data for selected channels only"""
@@ -298,10 +366,25 @@ class eegDashboard:
         selectedNames = [self.channelNames[i] for i in self.selectedChannels]
         return selectedData, selectedNames
 
+    def scheduleDebounced(self, key, callback, delayMs=80):
+        """Run callback once after delayMs, replacing a call still pending under the same key"""
+        pendingId = self.pendingCallbacks.pop(key, None)
+        if pendingId is not None:
+            self.rootWindow.after_cancel(pendingId)
+
+        def runCallback():
+            self.pendingCallbacks.pop(key, None)
+            callback()
+
+        self.pendingCallbacks[key] = self.rootWindow.after(delayMs, runCallback)
+
     def onTimeScaleChange(self, event=None):
         """Handle time scale change"""
         try:
             newTimeScale = float(self.timeScaleVar.get())
+            # <<ComboboxSelected>> also fires when the current value is picked again
+            if newTimeScale == self.timeScale:
+                return
             self.timeScale = newTimeScale
             self.windowSizeSeconds = newTimeScale  # Update for compatibility
             if self.eegData is not None:
@@ -314,6 +397,8 @@ class eegDashboard:
         """Handle amplitude scale change"""
         try:
             newAmplitudeScale = float(self.amplitudeScaleVar.get())
+            if newAmplitudeScale == self.amplitudeScale:
+                return
             self.amplitudeScale = newAmplitudeScale
             if self.eegData is not None:
                 self.updatePlot()
@@ -323,13 +408,16 @@ class eegDashboard:
     def onFilterChange(self, event=None):
         """Handle filter setting changes"""
         try:
-            # Update lowpass filter
             lpValue = self.lowpassVar.get()
-            self.lowpassFilter = None if lpValue == "None" else float(lpValue)
-
-            # Update highpass filter
             hpValue = self.highpassVar.get()
-            self.highpassFilter = None if hpValue == "None" else float(hpValue)
+            newLowpass = None if lpValue == "None" else float(lpValue)
+            newHighpass = None if hpValue == "None" else float(hpValue)
+            if (newLowpass, newHighpass) == (self.lowpassFilter, self.highpassFilter):
+                return
+
+            # Update lowpass and highpass filters
+            self.lowpassFilter = newLowpass
+            self.highpassFilter = newHighpass
 
             if self.eegData is not None:
                 self.updatePlot()
@@ -366,6 +454,9 @@ class eegDashboard:
                 self.channelNames = rawData.ch_names
                 self.edfFilePath = filePath
 
+                # The channel window was built for the previous file's channels
+                self.destroyChannelWindow()
+
                 # Initialize selected channels (all channels by default)
                 self.selectedChannels = list(range(len(self.channelNames)))
 
@@ -665,9 +756,10 @@ class eegDashboard:
         currentWindow = int(self.currentWindowStart / self.timeScale) + 1
         totalWindows = int(np.ceil(totalDuration / self.timeScale))
 
-        self.windowInfoLabel.config(
-            text=f"Window {currentWindow}/{totalWindows} "
-                 f"({self.currentWindowStart:.1f}-{self.currentWindowStart + self.timeScale:.1f}s)"
+        self.windowInfoLabel.tk.call(
+            *self.windowInfoTextCommand,
+            f"Window {currentWindow}/{totalWindows} "
+            f"({self.currentWindowStart:.1f}-{self.currentWindowStart + self.timeScale:.1f}s)"
         )
 
     def nextWindow(self):
@@ -750,12 +842,10 @@ class eegDashboard:
 
     def updateCurrentAnnotationsDisplay(self):
         """Update the display of annotations for current window"""
-        self.currentAnnotationsText.delete(1.0, tk.END)
-
         windowStart = self.currentWindowStart
         windowEnd = self.currentWindowStart + self.windowSizeSeconds
 
-        annotationCount = 0
+        annotationLines = []
         for annotationKey, annotationList in self.annotations.items():
             for annotation in annotationList:
                 startTime = annotation.get('startTime', 0)
@@ -763,14 +853,23 @@ class eegDashboard:
 
                 # Check if annotation overlaps with current window
                 if startTime < windowEnd and endTime > windowStart:
-                    annotationCount += 1
                     overlapStart = max(startTime, windowStart)
                     overlapEnd = min(endTime, windowEnd)
 
-                    self.currentAnnotationsText.insert(tk.END,
-                                                       f"{annotationCount}. {annotation['text']} "
-                                                       f"({overlapStart:.2f}s - {overlapEnd:.2f}s) "
-                                                       f"[{annotation['timestamp'][:19]}]\n")
+                    annotationLines.append(f"{len(annotationLines) + 1}. {annotation['text']} "
+                                           f"({overlapStart:.2f}s - {overlapEnd:.2f}s) "
+                                           f"[{annotation['timestamp'][:19]}]\n")
+
+        # Navigating through windows without annotations would otherwise clear and relayout
+        # the Text widget on every plot update
+        annotationsText = "".join(annotationLines)
+        if annotationsText == self.shownAnnotationsText:
+            return
+        self.shownAnnotationsText = annotationsText
+        self.currentAnnotationsText.configure(state=tk.NORMAL)
+        self.currentAnnotationsText.delete(1.0, tk.END)
+        self.currentAnnotationsText.insert(tk.END, annotationsText)
+        self.currentAnnotationsText.configure(state=tk.DISABLED)
 
     def saveAnnotations(self):
         """Save annotations to JSON file"""
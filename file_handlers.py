@@ -4,13 +4,25 @@ File handling module for EDF/BDF loading and annotation I/O operations, refactor
 
 import os
 import json
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional, Tuple, List
 import mne
 import numpy as np
+from scipy import signal
 from PyQt6.QtWidgets import QFileDialog, QMessageBox, QWidget
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard json module
+    orjson = None
+
+from EEG_Annotation_Desktop__Application import utils_numba
 from EEG_Annotation_Desktop__Application.models import EEGData, AnnotationCollection, Annotation
 
+# Butterworth order used for each display filter
+FILTER_ORDER = 4
+
 
 class EEGFileHandler:
     """Handles loading and processing of EEG files."""
@@ -39,7 +51,8 @@ class EEGFileHandler:
                 except:
                     raw_data = mne.io.read_raw_bdf(file_path, preload=True, verbose=False)
             
-            data = raw_data.get_data()
+            # Channel-major and C-contiguous, so a window slice is one run per channel
+            data = np.ascontiguousarray(raw_data.get_data())
             sampling_freq = raw_data.info['sfreq']
             channel_names = raw_data.ch_names
             duration = data.shape[1] / sampling_freq
@@ -55,7 +68,31 @@ class EEGFileHandler:
         except Exception as e:
             print(f"Error loading EEG file: {e}")
             return None
-    
+
+    @staticmethod
+    def resample_for_display(eeg_data: EEGData, target_sfreq: float) -> EEGData:
+        """
+        Downsample EEG data in place when it is recorded far above the display rate.
+
+        Args:
+            eeg_data: Loaded EEG data (the file on disk is left untouched)
+            target_sfreq: Sampling frequency to use for display
+
+        Returns:
+            The same EEGData object, resampled if needed
+        """
+        if not target_sfreq or eeg_data.sampling_freq <= 2 * target_sfreq:
+            return eeg_data
+        try:
+            down = eeg_data.sampling_freq / target_sfreq
+            eeg_data.data = np.ascontiguousarray(
+                mne.filter.resample(eeg_data.data, down=down, npad='auto', axis=-1, verbose=False))
+            eeg_data.sampling_freq = eeg_data.sampling_freq / down
+            eeg_data.duration = eeg_data.n_samples / eeg_data.sampling_freq
+        except Exception as e:
+            print(f"Resample error: {e}")
+        return eeg_data
+
     @staticmethod
     def get_file_dialog_path(parent: QWidget) -> Optional[str]:
         """
@@ -107,8 +144,13 @@ class AnnotationFileHandler:
             return False
         
         try:
-            with open(file_path, 'w') as f:
-                json.dump(annotation_collection.to_dict(), f, indent=2)
+            if orjson is not None:
+                with open(file_path, 'wb') as f:
+                    f.write(orjson.dumps(annotation_collection.to_dict(),
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(file_path, 'w') as f:
+                    json.dump(annotation_collection.to_dict(), f, indent=2)
             
             QMessageBox.information(parent, "Success", f"Annotations saved to {file_path}")
             return True
@@ -141,21 +183,20 @@ class AnnotationFileHandler:
             return None
         
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
             
-            annotations = {}
-            for key, ann_list in data.get("annotations", {}).items():
-                annotations[key] = [
-                    Annotation.create(
-                        text=ann['text'],
-                        start_time=ann['startTime'],
-                        end_time=ann['endTime'],
-                        color=ann['color'],
-                        channels=ann.get('channels', [])
-                    )
-                    for ann in ann_list
-                ]
+            # One fallback timestamp for the whole file instead of a datetime.now() per annotation
+            loaded_at = datetime.now().isoformat()
+            from_dict = Annotation.from_dict
+            annotations = {
+                key: [from_dict(ann, loaded_at) for ann in ann_list]
+                for key, ann_list in data.get("annotations", {}).items()
+            }
             
             collection = AnnotationCollection(
                 annotations=annotations,
@@ -192,18 +233,44 @@ class FilterHandler:
                             lowpass: Optional[float] = None,
                             highpass: Optional[float] = None) -> np.ndarray:
         """
-        Apply filters to a small 2D window array.
+        Apply zero-phase Butterworth filters to a small 2D window array.
         """
         if lowpass is None and highpass is None:
             return data
         try:
-            info = mne.create_info(ch_names=channel_names, sfreq=sampling_freq, ch_types='eeg')
-            raw_temp = mne.io.RawArray(data.copy(), info, verbose=False)
-            if lowpass is not None:
-                raw_temp.filter(None, lowpass, verbose=False)
-            if highpass is not None:
-                raw_temp.filter(highpass, None, verbose=False)
-            return raw_temp.get_data()
+            sos, zi = _design_sos(lowpass, highpass, float(sampling_freq))
+            if sos is None:
+                return data
+            return utils_numba.sosfiltfilt(sos, zi, data).astype(data.dtype, copy=False)
         except Exception as e:
             print(f"Filter window error: {e}")
             return data
+
+    @staticmethod
+    def decimate_array(data: np.ndarray, factor: int) -> np.ndarray:
+        """
+        Anti-alias filter and downsample a 2D window array by an integer factor.
+        """
+        if factor <= 1:
+            return data
+        try:
+            decimated = signal.decimate(data, factor, ftype='iir', axis=1, zero_phase=True)
+            return decimated.astype(data.dtype, copy=False)
+        except Exception as e:
+            print(f"Decimate window error: {e}")
+            return data[:, ::factor]
+
+
+@lru_cache(maxsize=32)
+def _design_sos(lowpass: Optional[float], highpass: Optional[float], sampling_freq: float):
+    """Design (and cache) the SOS cascade and its steady-state initial conditions."""
+    nyquist = sampling_freq / 2.0
+    sections = []
+    if lowpass is not None and 0 < lowpass < nyquist:
+        sections.append(signal.butter(FILTER_ORDER, lowpass, btype='lowpass', fs=sampling_freq, output='sos'))
+    if highpass is not None and 0 < highpass < nyquist:
+        sections.append(signal.butter(FILTER_ORDER, highpass, btype='highpass', fs=sampling_freq, output='sos'))
+    if not sections:
+        return None, None
+    sos = np.ascontiguousarray(np.vstack(sections))
+    return sos, signal.sosfilt_zi(sos)
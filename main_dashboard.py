@@ -4,7 +4,7 @@ Professional UI update.
 """
 
 import os
-import numpy as np
+from functools import partial
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QMessageBox, QSplitter, QStatusBar, QLabel,
     QToolBar, QComboBox, QToolButton, QSizePolicy
@@ -16,7 +16,7 @@ from EEG_Annotation_Desktop__Application.models import EEGData, DisplaySettings,
 from EEG_Annotation_Desktop__Application.file_handlers import EEGFileHandler, AnnotationFileHandler
 from EEG_Annotation_Desktop__Application.plotting import EEGPlotter
 from EEG_Annotation_Desktop__Application.ui_components import (
-    LeftSidebarWidget, AnnotationPanel, EditAnnotationDialog, NavigationWidget
+    LeftSidebarWidget, AnnotationPanel, NavigationWidget, get_edit_annotation_dialog
 )
 from EEG_Annotation_Desktop__Application.annotation_system import AnnotationManager
 
@@ -58,6 +58,27 @@ STYLESHEET = """
         background-color: #ffffff;
         border-top: 1px solid #dcdfe6;
     }
+    QLabel#appLogo {
+        font-weight: bold;
+        font-size: 16px;
+        color: #2c3e50;
+    }
+    QLabel#panelHeader {
+        font-size: 14px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QToolButton#collapsibleToggle {
+        border: none;
+        font-weight: bold;
+        text-align: left;
+        padding: 5px;
+        background-color: #f8f9fa;
+        border-radius: 4px;
+    }
+    QToolButton#collapsibleToggle:hover {
+        background-color: #e9ecef;
+    }
     QStatusBar::item {
         border: none;
     }
@@ -135,7 +156,7 @@ STYLESHEET = """
     QPushButton#dangerButton:hover {
         background-color: #bb2d3b;
     }
-    QTableWidget {
+    QTableView {
         border: 1px solid #e0e0e0;
         gridline-color: #e9ecef;
         background-color: #ffffff;
@@ -147,7 +168,7 @@ STYLESHEET = """
         border-bottom: 1px solid #dcdfe6;
         font-weight: bold;
     }
-    QTableWidget::item:selected {
+    QTableView::item:selected {
         background-color: #cfe2ff;
         color: #000;
     }
@@ -172,6 +193,20 @@ STYLESHEET = """
     }
 """
 
+# Dark theme is derived once from the light stylesheet by swapping color tokens
+DARK_COLOR_MAP = {
+    "#f0f2f5": "#2b2b2b",
+    "#ffffff": "#3c3c3c",
+    "#2c3e50": "#d0d0d0",
+    "#495057": "#b0b0b0",
+    "#212529": "#e0e0e0",
+    "#e9ecef": "#454545",
+    "#dcdfe6": "#555555",
+}
+DARK_STYLESHEET = STYLESHEET
+for _light, _dark in DARK_COLOR_MAP.items():
+    DARK_STYLESHEET = DARK_STYLESHEET.replace(_light, _dark)
+
 class EEGDashboard(QMainWindow):
     """Main dashboard class that coordinates all components."""
 
@@ -187,6 +222,10 @@ class EEGDashboard(QMainWindow):
         self.display_settings = DisplaySettings()
         self.annotation_collection = None
         self.current_window_start = 0
+        self._last_window_info_key = None
+        self._shown_annotations = (None, None)  # (collection, version) last pushed to the panel
+        self._last_window_key = None
+        self._last_window_data = None
 
         # Playback
         self.playback_timer = QTimer(self)
@@ -239,6 +278,7 @@ class EEGDashboard(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.window_info_label = QLabel("No file loaded.")
+        self.window_info_label.setTextFormat(Qt.TextFormat.PlainText)
         self.status_bar.addPermanentWidget(self.window_info_label)
 
     def _create_toolbar(self):
@@ -248,7 +288,7 @@ class EEGDashboard(QMainWindow):
 
         # Logo
         lbl_logo = QLabel(" EEG-Annotator")
-        lbl_logo.setStyleSheet("font-weight: bold; font-size: 16px; color: #2c3e50;")
+        lbl_logo.setObjectName("appLogo")
         toolbar.addWidget(lbl_logo)
         toolbar.addSeparator()
 
@@ -278,8 +318,8 @@ class EEGDashboard(QMainWindow):
         toolbar.addWidget(spacer)
 
         # Utilities
-        action_zoom_in = self._create_action("zoom-in", "Zoom In", lambda: self._zoom(1.2))
-        action_zoom_out = self._create_action("zoom-out", "Zoom Out", lambda: self._zoom(0.8))
+        action_zoom_in = self._create_action("zoom-in", "Zoom In", partial(self._zoom, 1.2))
+        action_zoom_out = self._create_action("zoom-out", "Zoom Out", partial(self._zoom, 0.8))
         toolbar.addAction(action_zoom_in)
         toolbar.addAction(action_zoom_out)
 
@@ -289,7 +329,10 @@ class EEGDashboard(QMainWindow):
         if checkable: action.setCheckable(True)
         return action
 
-    def _on_time_scale_change(self, val): self.display_settings.time_scale = val; self._update_all()
+    def _on_time_scale_change(self, val):
+        # Re-picking the current window length in the combo is not a change
+        if val == self.display_settings.time_scale: return
+        self.display_settings.time_scale = val; self._update_all()
     def _on_amplitude_scale_change(self, val): self.display_settings.amplitude_scale = val; self._update_all()
     def _on_filter_change(self, lp, hp, notch):
         self.display_settings.lowpass_filter = lp
@@ -317,12 +360,25 @@ class EEGDashboard(QMainWindow):
             self.current_window_start += 1
             self._update_all()
 
-    def _on_channel_selection_apply(self, sel): self.display_settings.selected_channels = sel; self._update_all()
-    def _on_channel_selection(self, sel): self.annotation_manager.set_selected_channels(sel); self._update_all()
+    def _on_channel_selection_apply(self, sel):
+        if sorted(sel) == sorted(self.display_settings.selected_channels): return
+        self.display_settings.selected_channels = sel
+        self._update_all()
+
+    def _on_channel_selection(self, sel):
+        if sorted(sel) == sorted(self.annotation_manager.selected_channels): return
+        self.annotation_manager.set_selected_channels(sel)
+        self._update_all()
+
     def _on_mouse_press(self, e): self.annotation_manager.handle_mouse_press(e, self.action_anno_mode.isChecked())
     def _on_mouse_move(self, e): self.annotation_manager.handle_mouse_move(e, self.action_anno_mode.isChecked())
     def _on_mouse_release(self, e): self.annotation_manager.handle_mouse_release(e, self.action_anno_mode.isChecked())
-    def _on_selection_change(self): self._update_all()
+    def _on_selection_change(self):
+        # While dragging only the selection span moves, so blit it instead of replotting
+        if self.annotation_manager.selection_state.mouse_pressed and self.plotter.update_selection(self.annotation_manager.selection_state):
+            return
+        self._update_all()
+
     def _on_add_annotation(self, text): pass
 
     def _on_delete_selected_annotation(self):
@@ -338,21 +394,19 @@ class EEGDashboard(QMainWindow):
             if idx < len(all_annotations):
                 to_delete.append(all_annotations[idx])
         
-        # Remove them
-        for ann in to_delete:
-            self.annotation_collection.remove_annotation(ann)
+        self.annotation_collection.remove_many(to_delete)
             
         self._update_all()
 
     def _on_edit_annotation(self, row, col):
         idx = self.annotation_panel.get_selected_annotation_index()
         if idx is None: return
-        ann = self.annotation_collection.get_all_annotations()[idx]
-        dialog = EditAnnotationDialog(self, ann, self.annotation_manager.predefined_annotations)
+        ann = self.annotation_collection.get(idx)
+        max_time = self.eeg_data.total_duration if self.eeg_data else None
+        dialog = get_edit_annotation_dialog(self, ann, self.annotation_manager.predefined_annotations, max_time)
         if dialog.exec() and dialog.result:
-            ann.text = dialog.result["text"]
-            ann.start_time = dialog.result["start_time"]
-            ann.end_time = dialog.result["end_time"]
+            ann.update(dialog.result["text"], dialog.result["start_time"], dialog.result["end_time"])
+            self.annotation_collection.invalidate_cache()
             self._update_all()
 
     def _on_save_annotations(self):
@@ -369,7 +423,7 @@ class EEGDashboard(QMainWindow):
 
     def _jump_to_annotation(self, idx):
         if not self.annotation_collection or not self.eeg_data: return
-        ann = self.annotation_collection.get_all_annotations()[idx]
+        ann = self.annotation_collection.get(idx)
         self.current_window_start = ann.start_time
         self._update_all()
 
@@ -380,16 +434,23 @@ class EEGDashboard(QMainWindow):
         eeg_data = EEGFileHandler.load_eeg_file(file_path)
         if not eeg_data: return QMessageBox.critical(self, "Error", "Failed to load EEG file.")
 
+        # Annotations are time-based, so only the in-memory copy is downsampled
+        native_sfreq = eeg_data.sampling_freq
+        eeg_data = EEGFileHandler.resample_for_display(eeg_data, self.display_settings.target_display_sfreq)
+
         self.eeg_data = eeg_data
+        self.plotter.build_pyramid(eeg_data)
+        self._last_window_key = None
+        self._last_window_data = None
         self.display_settings.selected_channels = list(range(len(eeg_data.channel_names)))
         self.current_window_start = 0
         self.left_sidebar.reset_filters()
 
-        self.annotation_collection = AnnotationCollection.create_empty(os.path.basename(file_path), self.display_settings.time_scale, eeg_data.sampling_freq)
+        self.annotation_collection = AnnotationCollection.create_empty(os.path.basename(file_path), self.display_settings.time_scale, native_sfreq)
         self.annotation_manager.set_annotation_collection(self.annotation_collection)
         self.annotation_manager.clear_selection()
         
-        self.left_sidebar.update_file_info(os.path.basename(file_path), eeg_data.total_duration, eeg_data.sampling_freq, len(eeg_data.channel_names), eeg_data.channel_names)
+        self.left_sidebar.update_file_info(os.path.basename(file_path), eeg_data.total_duration, native_sfreq, len(eeg_data.channel_names), eeg_data.channel_names)
         self._update_all()
         self.status_bar.showMessage(f"Loaded {os.path.basename(file_path)}", 5000)
 
@@ -400,15 +461,38 @@ class EEGDashboard(QMainWindow):
         self._update_annotations_display()
 
     def _update_plot(self):
-        annotations = self.annotation_collection.get_all_annotations() if self.annotation_collection else []
-        self.plotter.plot_eeg_data(self.eeg_data, self.display_settings, self.current_window_start, self.annotation_manager.selection_state, annotations)
+        window_end = self.current_window_start + self.display_settings.time_scale
+        annotations = self.annotation_collection.get_annotations_in_range(self.current_window_start, window_end) if self.annotation_collection else []
+        self.plotter.plot_eeg_data(self.eeg_data, self.display_settings, self.current_window_start, self.annotation_manager.selection_state, annotations,
+                                   window_data=self._get_window_data())
+
+    def _get_window_data(self):
+        """Return the filtered, decimated window, reusing the last one when its inputs are unchanged."""
+        ds = self.display_settings
+        start_samp, stop_samp = self.plotter.get_window_bounds(self.eeg_data, ds, self.current_window_start)
+        decim = self.plotter.get_decimation(stop_samp - start_samp)
+        key = (start_samp, stop_samp, tuple(ds.selected_channels), ds.lowpass_filter, ds.highpass_filter, decim)
+        if key != self._last_window_key or self._last_window_data is None:
+            self._last_window_data = self.plotter.prepare_window_data(self.eeg_data, ds, start_samp, stop_samp, decim)
+            self._last_window_key = key
+        return self._last_window_data
 
     def _update_window_info(self):
-        total_windows = int(np.ceil(self.eeg_data.total_duration / self.display_settings.time_scale))
-        current_window = int(self.current_window_start / self.display_settings.time_scale) + 1
-        self.window_info_label.setText(f"Window {current_window}/{total_windows} ({self.current_window_start:.1f}s - {self.current_window_start + self.display_settings.time_scale:.1f}s)")
+        ts = self.display_settings.time_scale
+        # The label also shows the window range, so key on the start time rather than the window index
+        key = (self.current_window_start, ts, self.eeg_data.total_duration)
+        if key == self._last_window_info_key: return
+        self._last_window_info_key = key
+        total_windows = int(-(-self.eeg_data.total_duration // ts))
+        current_window = int(self.current_window_start / ts) + 1
+        self.window_info_label.setText(f"Window {current_window}/{total_windows} ({self.current_window_start:.1f}s - {self.current_window_start + ts:.1f}s)")
 
     def _update_annotations_display(self):
+        # _update_all runs on every navigation step; only push the list when it changed
+        collection = self.annotation_collection
+        version = collection.version if collection else None
+        if collection is self._shown_annotations[0] and version == self._shown_annotations[1]: return
+        self._shown_annotations = (collection, version)
         annotations = self.annotation_collection.get_all_annotations() if self.annotation_collection else []
         self.annotation_panel.update_annotations_display(annotations)
 
@@ -423,5 +507,11 @@ class EEGDashboard(QMainWindow):
         self.left_sidebar.amp_slider.setValue(new_val)
 
     def _toggle_theme(self, is_dark):
-        dark_stylesheet = STYLESHEET.replace("#f0f2f5", "#2b2b2b").replace("#ffffff", "#3c3c3c").replace("#2c3e50", "#d0d0d0").replace("#495057", "#b0b0b0").replace("#212529", "#e0e0e0").replace("#e9ecef", "#454545").replace("#dcdfe6", "#555555")
-        self.setStyleSheet(dark_stylesheet if is_dark else STYLESHEET)
+        stylesheet = DARK_STYLESHEET if is_dark else STYLESHEET
+        if stylesheet == self.styleSheet(): return
+        # Repolishing every child is unavoidable with QSS colors; suppress the intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(stylesheet)
+        finally:
+            self.setUpdatesEnabled(True)
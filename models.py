@@ -3,13 +3,20 @@ Data models and configuration classes for the EEG Dashboard application.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
 from datetime import datetime
 
+import numpy as np
+
 
 @dataclass
 class EEGData:
-    """Container for EEG data and metadata."""
+    """
+    Container for EEG data and metadata.
+
+    data is a C-contiguous array of shape (n_channels, n_samples): each channel's
+    samples are adjacent in memory, so slicing a time window copies one run per channel.
+    """
     data: Any  # numpy array with shape (n_channels, n_samples)
     sampling_freq: float
     channel_names: List[str]
@@ -39,6 +46,7 @@ class Annotation:
     duration: float
     color: str
     channels: Optional[List[str]] = field(default_factory=list)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def create(cls, text: str, start_time: float, end_time: float, color: str, channels: Optional[List[str]] = None) -> 'Annotation':
@@ -54,17 +62,45 @@ class Annotation:
             channels=channels or []
         )
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], default_timestamp: str) -> 'Annotation':
+        """Rebuild an annotation saved by to_dict, keeping its original timestamp when present."""
+        start_time, end_time = data['startTime'], data['endTime']
+        return cls(
+            text=data['text'],
+            start_time=round(start_time, 3),
+            end_time=round(end_time, 3),
+            timestamp=data.get('timestamp') or default_timestamp,
+            duration=round(abs(end_time - start_time), 3),
+            color=data['color'],
+            channels=data.get('channels') or []
+        )
+
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            'text': self.text,
-            'startTime': self.start_time,
-            'endTime': self.end_time,
-            'timestamp': self.timestamp,
-            'duration': self.duration,
-            'color': self.color,
-            'channels': self.channels
-        }
+        """Convert to dictionary for JSON serialization (built once, reused until invalidated)."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'text': self.text,
+                'startTime': self.start_time,
+                'endTime': self.end_time,
+                'timestamp': self.timestamp,
+                'duration': self.duration,
+                'color': self.color,
+                'channels': self.channels
+            }
+        return self._dict_cache
+
+    def update(self, text: str, start_time: float, end_time: float):
+        """Edit the label and time range, keeping the stored duration in step."""
+        self.text = text
+        self.start_time = round(start_time, 3)
+        self.end_time = round(end_time, 3)
+        self.duration = round(abs(end_time - start_time), 3)
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """Drop the cached dictionary after the annotation has been edited."""
+        self._dict_cache = None
 
 
 @dataclass
@@ -75,6 +111,9 @@ class AnnotationCollection:
     window_size: float
     sampling_freq: float
     export_timestamp: str
+    _sorted_cache: Optional[List[Annotation]] = field(default=None, init=False, repr=False, compare=False)
+    _time_arrays: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
     
     @classmethod
     def create_empty(cls, edf_file: str, window_size: float, sampling_freq: float) -> 'AnnotationCollection':
@@ -91,6 +130,7 @@ class AnnotationCollection:
         """Add an annotation and return its key."""
         key = f"annotation_{len(self.annotations)}"
         self.annotations[key] = [annotation]
+        self._sorted_cache = None
         return key
     
     def remove_annotation(self, annotation_to_remove: Annotation):
@@ -102,22 +142,70 @@ class AnnotationCollection:
                 break
         if key_to_delete:
             del self.annotations[key_to_delete]
+            self._sorted_cache = None
+
+    def remove_many(self, annotations_to_remove: Iterable[Annotation]):
+        """Remove several annotation objects in a single pass over the collection."""
+        ids_to_remove = {id(ann) for ann in annotations_to_remove}
+        if not ids_to_remove:
+            return
+        remaining = {}
+        for key, ann_list in self.annotations.items():
+            kept = [ann for ann in ann_list if id(ann) not in ids_to_remove]
+            if kept:
+                remaining[key] = kept
+        self.annotations = remaining
+        self._sorted_cache = None
 
     def get_all_annotations(self) -> List[Annotation]:
         """Return a flat list of all annotation objects, sorted by start time."""
-        all_ann = [ann for ann_list in self.annotations.values() for ann in ann_list]
-        all_ann.sort(key=lambda x: x.start_time)
-        return all_ann
+        return list(self._get_sorted())
+
+    def get(self, index: int) -> Annotation:
+        """Return the annotation at the given position in start-time order."""
+        return self._get_sorted()[index]
+
+    def invalidate_cache(self):
+        """Drop the cached ordering after an annotation's times have been edited."""
+        self._sorted_cache = None
+
+    def _get_sorted(self) -> List[Annotation]:
+        if self._sorted_cache is None:
+            all_ann = [ann for ann_list in self.annotations.values() for ann in ann_list]
+            all_ann.sort(key=lambda x: x.start_time)
+            self._sorted_cache = all_ann
+            self._time_arrays = None
+            self._version += 1
+        return self._sorted_cache
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever annotations were added, removed or edited (cache invalidated)."""
+        self._get_sorted()
+        return self._version
+
+    def _get_time_arrays(self):
+        """Return (starts, ends) arrays aligned with the sorted annotation list."""
+        sorted_annotations = self._get_sorted()
+        if self._time_arrays is None:
+            count = len(sorted_annotations)
+            starts = np.fromiter((a.start_time for a in sorted_annotations), dtype=np.float64, count=count)
+            ends = np.fromiter((a.end_time for a in sorted_annotations), dtype=np.float64, count=count)
+            self._time_arrays = (starts, ends)
+        return self._time_arrays
 
     def get_annotations_in_range(self, start_time: float, end_time: float) -> List[Annotation]:
-        """Get all annotations that overlap with the given time range."""
-        overlapping = []
-        for annotation_list in self.annotations.values():
-            for annotation in annotation_list:
-                if (annotation.start_time < end_time and 
-                    annotation.end_time > start_time):
-                    overlapping.append(annotation)
-        return overlapping
+        """
+        Get all annotations that overlap with the given time range, in start-time order.
+
+        Punctual annotations placed exactly at start_time are included.
+        """
+        sorted_annotations = self._get_sorted()
+        starts, ends = self._get_time_arrays()
+        # Starts are sorted, so everything from stop onwards begins after the range
+        stop = int(np.searchsorted(starts, end_time, side='left'))
+        mask = (ends[:stop] > start_time) | (starts[:stop] >= start_time)
+        return [sorted_annotations[i] for i in np.flatnonzero(mask)]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -141,6 +229,7 @@ class DisplaySettings:
     lowpass_filter: Optional[float] = None
     highpass_filter: Optional[float] = None
     selected_channels: List[int] = None
+    target_display_sfreq: float = 500.0
     
     def __post_init__(self):
         if self.selected_channels is None:
@@ -6,12 +6,130 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+from matplotlib.patches import Rectangle
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from typing import List, Optional, Tuple
 
+from EEG_Annotation_Desktop__Application import utils_numba
 from EEG_Annotation_Desktop__Application.file_handlers import FilterHandler
 from EEG_Annotation_Desktop__Application.models import EEGData, DisplaySettings, SelectionState, Annotation
 
+# Pre-filter decimation keeps the lowpass cutoff below this fraction of the reduced Nyquist
+NYQUIST_SAFETY = 0.8
+# scipy.signal.decimate's IIR anti-alias filter is only recommended up to this factor
+MAX_PREFILTER_DECIMATION = 13
+# Channel toggles are reported at most once per frame (~60 Hz)
+CHANNEL_SELECTION_FLUSH_MS = 16
+# Trace colours, indexed by whether the channel is selected for annotation
+# (a less saturated, professional dark slate blue, and red for selected channels)
+TRACE_COLORS = to_rgba_array(['#2C3E50', '#E74C3C'])
+
+
+def minmax_downsample(data: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Reduce each channel to the min and max of every `factor` samples.
+
+    Unlike plain striding this keeps spike peaks and the signal envelope;
+    the result has two points per bin (a trailing partial bin is kept).
+    """
+    if factor <= 1 or data.shape[1] < factor:
+        return data
+    return _minmax_bins(data, data, factor)
+
+
+def _minmax_bins(mins: np.ndarray, maxs: np.ndarray, factor: int) -> np.ndarray:
+    """Reduce min/max arrays over bins of `factor` columns and interleave them."""
+    num_channels, num_samples = mins.shape
+    num_full_bins = num_samples // factor
+    num_bins = -(-num_samples // factor)
+
+    out = np.empty((num_channels, num_bins * 2), dtype=mins.dtype)
+    full = num_full_bins * factor
+    out[:, 0:num_full_bins * 2:2] = mins[:, :full].reshape(num_channels, num_full_bins, factor).min(axis=2)
+    out[:, 1:num_full_bins * 2:2] = maxs[:, :full].reshape(num_channels, num_full_bins, factor).max(axis=2)
+    if num_bins > num_full_bins:
+        out[:, -2] = mins[:, full:].min(axis=1)
+        out[:, -1] = maxs[:, full:].max(axis=1)
+    return out
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution MinMax summary of a recording, built once per file.
+
+    Level k holds the per-channel min and max of every 4**k raw samples, so a
+    window query reads about as many values as there are pixels instead of the
+    whole raw slab.
+    """
+
+    FACTOR = 4
+    MIN_LEVEL_SAMPLES = 1024
+
+    def __init__(self, data: np.ndarray):
+        self.data = data  # raw samples, read only for the partial cells at window edges
+        self.levels = []  # (stride, mins, maxs), finest first
+        num_channels = data.shape[0]
+        mins = maxs = data
+        stride = 1
+        # Levels are display-only, so they are stored in float32
+        while mins.shape[1] // self.FACTOR >= self.MIN_LEVEL_SAMPLES:
+            usable = (mins.shape[1] // self.FACTOR) * self.FACTOR
+            mins = mins[:, :usable].reshape(num_channels, -1, self.FACTOR).min(axis=2).astype(np.float32, copy=False)
+            maxs = maxs[:, :usable].reshape(num_channels, -1, self.FACTOR).max(axis=2).astype(np.float32, copy=False)
+            stride *= self.FACTOR
+            self.levels.append((stride, mins, maxs))
+
+    def query(self, rows, start_sample: int, end_sample: int, decim: int) -> Optional[np.ndarray]:
+        """
+        Return the MinMax envelope of raw[rows, start_sample:end_sample] in bins of at least decim samples.
+
+        Bins are whole level cells, so they can be slightly wider than decim but never
+        narrower, and the result is never wider than minmax_downsample on the raw slice.
+        The partial cells at the window edges are read from the raw data, so no sample
+        outside the window contributes. Returns None when no level is coarse enough to help.
+        """
+        # The level whose whole-cell bin size comes closest to decim; the coarser one on a tie
+        level, bin_size = None, None
+        for stride, mins, maxs in self.levels:
+            if stride > decim:
+                break
+            candidate = stride * -(-decim // stride)
+            if bin_size is None or candidate <= bin_size:
+                level, bin_size = (stride, mins, maxs), candidate
+        if level is None:
+            return None
+
+        stride, mins, maxs = level
+        first, last = -(-start_sample // stride), end_sample // stride
+        if last <= first:
+            return None
+        factor = bin_size // stride
+        out = _minmax_bins(mins[rows, first:last], maxs[rows, first:last], factor)
+
+        # Samples before the first whole cell widen the first bin
+        head_end = first * stride
+        if head_end > start_sample:
+            head = self.data[rows, start_sample:head_end]
+            np.minimum(out[:, 0], head.min(axis=1), out=out[:, 0])
+            np.maximum(out[:, 1], head.max(axis=1), out=out[:, 1])
+
+        # Samples after the last whole cell fill the last bin, or form their own when it is full
+        tail_start = last * stride
+        if end_sample > tail_start:
+            tail = self.data[rows, tail_start:end_sample]
+            if (last - first) % factor == 0:
+                tail_bin = np.empty((out.shape[0], 2), dtype=out.dtype)
+                tail_bin[:, 0] = tail.min(axis=1)
+                tail_bin[:, 1] = tail.max(axis=1)
+                out = np.concatenate((out, tail_bin), axis=1)
+            else:
+                np.minimum(out[:, -2], tail.min(axis=1), out=out[:, -2])
+                np.maximum(out[:, -1], tail.max(axis=1), out=out[:, -1])
+        return out
+
 
 class EEGPlotter(QWidget):
     """Handles EEG data plotting and visualization."""
@@ -23,6 +141,28 @@ class EEGPlotter(QWidget):
         self.display_settings = None
         self.eeg_data = None
         self.channel_spacing = 0
+        self._window = (0.0, 0.0)
+        self._background = None
+        self.ax = None
+        self.line_collection = None
+        self._selection_patch = None
+        self._frame_artists = []
+        self._pyramid = None
+        self._pyramid_source = None
+        self._channel_selection_key = None
+        self._channel_selection_source = None
+        self._channel_rows = slice(None)
+        self._channel_names = []
+        self._baselines = np.empty(0)
+        self._ytick_key = None
+        self._displayed_channel_names = []
+        self._channel_flush_pending = False
+        self._emitted_channels = frozenset()
+        self._selected_channels_list = []
+        self._spacing_cache = (None, None)
+        self._spacing_source = None
+        self._trace_colors_key = None
+        self._trace_colors = None
 
         # Use a cleaner facecolor for the figure
         self.figure = Figure(figsize=(16, 12), dpi=100, facecolor='#FFFFFF')
@@ -35,6 +175,7 @@ class EEGPlotter(QWidget):
         self.canvas.mpl_connect('button_press_event', self._on_mouse_press)
         self.canvas.mpl_connect('button_release_event', self._on_mouse_release)
         self.canvas.mpl_connect('motion_notify_event', self._on_mouse_move)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
 
         self.mouse_press_callback = None
         self.mouse_release_callback = None
@@ -67,84 +208,104 @@ class EEGPlotter(QWidget):
         if event.button == 1 and self.mouse_move_callback:
             self.mouse_move_callback(event)
 
+    def _on_draw(self, event):
+        """Cache the rendered figure (minus the animated selection) for blitting."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self._selection_patch is not None:
+            self.figure.draw_artist(self._selection_patch)
+
     def _handle_channel_selection_click(self, event):
         """Handle right-clicks on the plot to select channels for annotation."""
         if not event.inaxes or self.display_settings is None or self.eeg_data is None or self.channel_spacing == 0:
             return
 
-        ax = event.inaxes
-        num_displayed_channels = len(ax.get_yticklabels())
+        displayed_channel_names = self._displayed_channel_names
+        num_displayed_channels = len(displayed_channel_names)
         
         clicked_y = event.ydata
         clicked_channel_display_index = round(clicked_y / self.channel_spacing)
         clicked_channel_display_index = num_displayed_channels - 1 - clicked_channel_display_index
 
         if 0 <= clicked_channel_display_index < num_displayed_channels:
-            displayed_channel_names = [self.eeg_data.channel_names[i] for i in self.display_settings.selected_channels] or self.eeg_data.channel_names
             channel_name = displayed_channel_names[clicked_channel_display_index]
 
-            if channel_name in self.selected_annotation_channels:
-                self.selected_annotation_channels.remove(channel_name)
-            else:
-                self.selected_annotation_channels.add(channel_name)
-            
-            if self.channel_selection_callback:
-                self.channel_selection_callback(list(self.selected_annotation_channels))
+            self.selected_annotation_channels.symmetric_difference_update((channel_name,))
+
+            # Rapid toggles are coalesced into one callback (and so one replot)
+            if not self._channel_flush_pending:
+                self._channel_flush_pending = True
+                QTimer.singleShot(CHANNEL_SELECTION_FLUSH_MS, self._flush_channel_selection)
+
+    def _flush_channel_selection(self):
+        """Report the accumulated channel toggles, skipping toggles that cancelled out."""
+        self._channel_flush_pending = False
+        current = frozenset(self.selected_annotation_channels)
+        if current == self._emitted_channels:
+            return
+        self._emitted_channels = current
+        self._selected_channels_list = list(current)
+        if self.channel_selection_callback:
+            self.channel_selection_callback(self._selected_channels_list)
 
     def clear_channel_selection(self):
         """Clear the set of selected channels for annotation."""
         self.selected_annotation_channels.clear()
+        self._emitted_channels = frozenset()
+        self._selected_channels_list = []
 
     def plot_eeg_data(self, eeg_data: EEGData,
                       display_settings: DisplaySettings,
                       current_window_start: float,
                       selection_state: SelectionState,
-                      annotations: List[Annotation] = None) -> None:
-        """Plot EEG data for the current window."""
+                      annotations: List[Annotation] = None,
+                      window_data: Optional[np.ndarray] = None) -> None:
+        """
+        Plot EEG data for the current window.
+
+        window_data may be passed in when the caller already holds the filtered and
+        decimated window (see prepare_window_data); otherwise it is computed here.
+        """
         if eeg_data is None:
             return
 
         self.eeg_data = eeg_data
         self.display_settings = display_settings
-        self.figure.clear()
-
-        selected_data, selected_names = self._get_selected_channel_data(
-            eeg_data, display_settings.selected_channels
-        )
-
-        samples_per_window = int(display_settings.time_scale * eeg_data.sampling_freq)
-        start_sample = int(current_window_start * eeg_data.sampling_freq)
-        end_sample = min(start_sample + samples_per_window, selected_data.shape[1])
-
-        window_data = selected_data[:, start_sample:end_sample]
-
-        if (display_settings.lowpass_filter is not None) or (display_settings.highpass_filter is not None):
-            window_data = FilterHandler.apply_filters_array(
-                data=window_data,
-                channel_names=selected_names,
-                sampling_freq=eeg_data.sampling_freq,
-                lowpass=display_settings.lowpass_filter,
-                highpass=display_settings.highpass_filter,
+        self._window = (current_window_start, display_settings.time_scale)
+        self._background = None
+        ax = self._ensure_axes()
+        # Only per-window overlays are rebuilt; the axes and trace collection persist
+        for artist in self._frame_artists:
+            artist.remove()
+        self._frame_artists = []
+
+        _, selected_names = self._get_channel_selection(eeg_data, display_settings.selected_channels)
+        # Right-click hit tests and annotation rows resolve against this plotted list
+        self._displayed_channel_names = selected_names
+
+        if window_data is None:
+            start_sample, end_sample = self.get_window_bounds(eeg_data, display_settings, current_window_start)
+            window_data = self.prepare_window_data(
+                eeg_data, display_settings, start_sample, end_sample,
+                self.get_decimation(end_sample - start_sample)
             )
 
-        num_window_samples = window_data.shape[1]
-        canvas_width = self.canvas.width() or 1500
-        max_points = max(800, int(canvas_width) - 50)
-        decim = max(1, num_window_samples // max_points)
-        if decim > 1:
-            window_data = window_data[:, ::decim]
-
         time_axis = np.linspace(
             current_window_start,
             current_window_start + display_settings.time_scale,
             window_data.shape[1]
         )
 
-        self.channel_spacing = self._calculate_channel_spacing(window_data)
-
-        ax = self.figure.add_subplot(111)
-        ax.set_position([0.08, 0.07, 0.90, 0.88])
-        ax.margins(x=0.002)
+        # Spacing only depends on which channels are shown and how they are filtered, so
+        # panning reuses it instead of rescanning every channel
+        spacing_key = (tuple(display_settings.selected_channels),
+                       display_settings.lowpass_filter, display_settings.highpass_filter)
+        cached_key, cached_spacing = self._spacing_cache
+        if cached_key == spacing_key and self._spacing_source is eeg_data:
+            self.channel_spacing = cached_spacing
+        else:
+            self.channel_spacing = self._calculate_channel_spacing(window_data)
+            self._spacing_cache = (spacing_key, self.channel_spacing)
+            self._spacing_source = eeg_data
 
         self._plot_channels(ax, time_axis, window_data, selected_names, self.channel_spacing)
 
@@ -155,27 +316,144 @@ class EEGPlotter(QWidget):
             self._draw_annotations(ax, annotations, current_window_start,
                                    display_settings.time_scale, self.channel_spacing)
 
-        if selection_state.has_selection:
-            self._draw_selection(ax, selection_state, current_window_start,
-                                 display_settings.time_scale)
+        self._set_selection_extent(selection_state, current_window_start,
+                                   display_settings.time_scale)
 
-        self.figure.subplots_adjust(left=0.06, right=0.995, top=0.92, bottom=0.08)
         self.canvas.draw_idle()
+
+    def _ensure_axes(self):
+        """Create the persistent axes, trace collection and selection patch on first use."""
+        if self.ax is not None:
+            return self.ax
+
+        ax = self.figure.add_subplot(111)
+        ax.set_position([0.08, 0.07, 0.90, 0.88])
+        ax.margins(x=0.002)
+
+        ax.set_xlabel('Time (seconds)', fontsize=9, labelpad=5, color='#555555')
+        # ax.set_ylabel('Channels', fontsize=9, labelpad=5, color='#555555') # Redundant with labels
+
+        # Very subtle horizontal grid
+        ax.grid(True, alpha=0.1, linestyle='-', linewidth=0.5, color='#E0E0E0')
+
+        ax.tick_params(axis='y', which='both', length=0, pad=5)
+        ax.tick_params(axis='x', colors='#555555')
+        ax.yaxis.set_ticks_position('left')
+
+        # Minimalist spines
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_visible(False) # Remove left spine, rely on ticks
+        ax.spines['bottom'].set_color('#CCCCCC')
+
+        # Bevel joins and butt caps are indistinguishable at this width but cheaper for Agg to stroke
+        self.line_collection = LineCollection([], linewidths=0.6, joinstyle='bevel', capstyle='butt')
+        ax.add_collection(self.line_collection, autolim=False)
+
+        # Muted yellow for selection; animated so drags can be blitted over the cached background
+        self._selection_patch = Rectangle((0, 0), 0, 1, transform=ax.get_xaxis_transform(),
+                                          alpha=0.2, color='#F1C40F', zorder=10, animated=True,
+                                          visible=False)
+        ax.add_patch(self._selection_patch)
+
+        self.figure.subplots_adjust(left=0.06, right=0.995, top=0.92, bottom=0.08)
+        self.ax = ax
+        return ax
     
-    def _get_selected_channel_data(self, eeg_data: EEGData,
-                                  selected_channels: List[int]) -> Tuple[np.ndarray, List[str]]:
+    def get_window_bounds(self, eeg_data: EEGData, display_settings: DisplaySettings,
+                          current_window_start: float) -> Tuple[int, int]:
+        """Return the (start, end) sample indices of the current window."""
+        samples_per_window = int(display_settings.time_scale * eeg_data.sampling_freq)
+        start_sample = int(current_window_start * eeg_data.sampling_freq)
+        end_sample = min(start_sample + samples_per_window, eeg_data.n_samples)
+        return start_sample, end_sample
+
+    def get_decimation(self, num_window_samples: int) -> int:
+        """Return the MinMax bin size that keeps roughly one bin per canvas pixel."""
+        canvas_width = self.canvas.width() or 1500
+        max_points = max(800, int(canvas_width) - 50)
+        # Up to 4 points per pixel (M4 rule) is drawn as-is
+        if num_window_samples <= 4 * max_points:
+            return 1
+        return max(1, num_window_samples // max_points)
+
+    def build_pyramid(self, eeg_data: EEGData) -> None:
+        """Precompute the MinMax pyramid used for unfiltered, zoomed-out windows."""
+        self._pyramid = MinMaxPyramid(eeg_data.data)
+        self._pyramid_source = eeg_data
+
+    def prepare_window_data(self, eeg_data: EEGData, display_settings: DisplaySettings,
+                            start_sample: int, end_sample: int, decim: int) -> np.ndarray:
+        """Slice, filter and MinMax-downsample the selected channels for one window."""
+        rows, selected_names = self._get_channel_selection(eeg_data, display_settings.selected_channels)
+        filtering = (display_settings.lowpass_filter is not None) or (display_settings.highpass_filter is not None)
+
+        # Filters need the raw samples; otherwise the pyramid already holds the envelope
+        if decim > 1 and not filtering and self._pyramid_source is eeg_data:
+            window_data = self._pyramid.query(rows, start_sample, end_sample, decim)
+            if window_data is not None:
+                return np.ascontiguousarray(window_data)
+
+        # Display does not need double precision; halve the bytes every later step touches
+        if isinstance(rows, slice):
+            window_data = np.ascontiguousarray(eeg_data.data[rows, start_sample:end_sample], dtype=np.float32)
+        else:
+            # Fancy indexing gathers the rows; the float64 -> float32 cast is one more pass
+            # (np.take into a float32 out buffer was measured slower and warned on the cast)
+            window_data = eeg_data.data[rows, start_sample:end_sample].astype(np.float32)
+
+        sampling_freq = eeg_data.sampling_freq
+        if filtering:
+            lowpass, highpass = display_settings.lowpass_filter, display_settings.highpass_filter
+            # With a lowpass well below the reduced Nyquist, nothing visible is lost by
+            # decimating first, so the filter runs on far fewer samples
+            if decim > 1 and lowpass is not None:
+                factor = min(decim, MAX_PREFILTER_DECIMATION, int(sampling_freq * NYQUIST_SAFETY / (2 * lowpass)))
+                if factor > 1 and (highpass is None or highpass < lowpass):
+                    window_data = FilterHandler.decimate_array(window_data, factor)
+                    sampling_freq /= factor
+                    decim //= factor
+            window_data = FilterHandler.apply_filters_array(
+                data=window_data,
+                channel_names=selected_names,
+                sampling_freq=sampling_freq,
+                lowpass=lowpass,
+                highpass=highpass,
+            )
+
+        if decim > 1:
+            window_data = minmax_downsample(window_data, decim)
+        return np.ascontiguousarray(window_data, dtype=np.float32)
+
+    def _get_channel_selection(self, eeg_data: EEGData, selected_channels: List[int]):
+        """Return a row indexer and the names for the selected channels, cached per selection."""
+        key = tuple(selected_channels)
+        if key == self._channel_selection_key and self._channel_selection_source is eeg_data:
+            return self._channel_rows, self._channel_names
+
         if not selected_channels:
-            return eeg_data.data, eeg_data.channel_names
-        
-        selected_data = eeg_data.data[selected_channels, :]
-        selected_names = [eeg_data.channel_names[i] for i in selected_channels]
-        return selected_data, selected_names
+            rows, names = slice(None), eeg_data.channel_names
+        else:
+            names = [eeg_data.channel_names[i] for i in selected_channels]
+            first = selected_channels[0]
+            # A contiguous ascending run is a basic slice, which views rows instead of copying them
+            if key == tuple(range(first, first + len(key))):
+                rows = slice(first, first + len(key))
+            else:
+                rows = np.asarray(selected_channels, dtype=np.intp)
+
+        self._channel_selection_key = key
+        self._channel_selection_source = eeg_data
+        self._channel_rows = rows
+        self._channel_names = names
+        return rows, names
     
     def _calculate_channel_spacing(self, window_data: np.ndarray) -> float:
         if window_data.size == 0:
             return 1.0
-        channel_stds = np.std(window_data, axis=1)
-        median_std = np.median(channel_stds[channel_stds > 0])
+        channel_stds = utils_numba.channel_stds(window_data)
+        positive = channel_stds[channel_stds > 0]
+        median_std = np.median(positive) if positive.size else 0.0
         if median_std == 0 or np.isnan(median_std):
             median_std = 1e-5 # Fallback for flat signals
         return median_std * 15 # Base spacing
@@ -183,12 +461,28 @@ class EEGPlotter(QWidget):
     def _plot_channels(self, ax, time_axis: np.ndarray, window_data: np.ndarray,
                       channel_names: List[str], channel_spacing: float) -> None:
         num_channels = len(channel_names)
+        if num_channels == 0:
+            return
 
-        for i in range(num_channels):
-            y_offset = (num_channels - 1 - i) * channel_spacing
-            # Use a less saturated, professional color (dark slate blue)
-            color = '#E74C3C' if channel_names[i] in self.selected_annotation_channels else '#2C3E50'
-            ax.plot(time_axis, window_data[i] + y_offset, color=color, linewidth=0.6)
+        # All traces go into a single LineCollection so Agg draws one artist
+        baselines = self._get_baselines(num_channels, channel_spacing)
+        # Fill the segment buffer in place rather than stacking broadcast copies
+        segments = np.empty((num_channels, window_data.shape[1], 2), dtype=np.float64)
+        segments[..., 0] = time_axis
+        np.add(window_data, baselines[:, None], out=segments[..., 1])
+
+        self.line_collection.set_segments(segments)
+        self.line_collection.set_color(self._get_trace_colors(channel_names))
+
+    def _get_trace_colors(self, channel_names: List[str]) -> np.ndarray:
+        """Return the RGBA colour of each trace, cached until the names or selection change."""
+        selected = self.selected_annotation_channels
+        key = (tuple(channel_names), frozenset(selected))
+        if key != self._trace_colors_key:
+            mask = np.fromiter((name in selected for name in channel_names), dtype=bool, count=len(channel_names))
+            self._trace_colors = TRACE_COLORS[mask.astype(np.intp)]
+            self._trace_colors_key = key
+        return self._trace_colors
 
     def _customize_plot(self, ax, time_axis: np.ndarray,
                        channel_names: List[str], display_settings: DisplaySettings, 
@@ -200,15 +494,16 @@ class EEGPlotter(QWidget):
             fontsize=10, pad=10, loc='left', color='#555555'
         )
 
-        ax.set_xlabel('Time (seconds)', fontsize=9, labelpad=5, color='#555555')
-        # ax.set_ylabel('Channels', fontsize=9, labelpad=5, color='#555555') # Redundant with labels
-        
+        # One collection for every per-second grid line; y spans the axes in axes coordinates
         time_grid_lines = np.arange(np.ceil(time_axis[0]), np.floor(time_axis[-1]) + 1)
-        for grid_time in time_grid_lines:
-            ax.axvline(x=grid_time, color='#E0E0E0', alpha=0.5, linestyle='--', linewidth=0.5)
-        
-        # Very subtle horizontal grid
-        ax.grid(True, alpha=0.1, linestyle='-', linewidth=0.5, color='#E0E0E0')
+        if time_grid_lines.size:
+            grid_segments = np.empty((time_grid_lines.size, 2, 2))
+            grid_segments[:, :, 0] = time_grid_lines[:, None]
+            grid_segments[:, :, 1] = (0, 1)
+            self._frame_artists.append(ax.add_collection(
+                LineCollection(grid_segments, colors='#E0E0E0', alpha=0.5, linestyles='--',
+                               linewidths=0.5, transform=ax.get_xaxis_transform()),
+                autolim=False))
         
         time_margin = (time_axis[-1] - time_axis[0]) * 0.01 if time_axis.size > 0 else 0.01
         ax.set_xlim(time_axis[0] - time_margin, time_axis[-1] + time_margin) if time_axis.size > 0 else None
@@ -225,85 +520,125 @@ class EEGPlotter(QWidget):
         if view_height <= 0:
             view_height = self.channel_spacing
             
+        # Tick text layout is costly for many channels, so only refresh it when it changes.
+        # Ticks go first because set_yticks widens the view to include every tick.
+        ytick_key = (self.channel_spacing, tuple(channel_names))
+        if ytick_key != self._ytick_key:
+            ax.set_yticks(self._get_baselines(num_channels, self.channel_spacing))
+            ax.set_yticklabels(channel_names, fontsize=8, color='#333333')
+            self._ytick_key = ytick_key
+
         ax.set_ylim(
             geometric_center - view_height / 2.0,
             geometric_center + view_height / 2.0
         )
 
-        y_positions = [(num_channels - 1 - i) * self.channel_spacing for i in range(num_channels)]
-        ax.set_yticks(y_positions)
-        ax.set_yticklabels(channel_names, fontsize=8, color='#333333')
-        ax.tick_params(axis='y', which='both', length=0, pad=5)
-        ax.tick_params(axis='x', colors='#555555')
-        ax.yaxis.set_ticks_position('left')
-
-        # Minimalist spines
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False) # Remove left spine, rely on ticks
-        ax.spines['bottom'].set_color('#CCCCCC')
+    def _get_baselines(self, num_channels: int, channel_spacing: float) -> np.ndarray:
+        """Return the y offset of each displayed channel, top channel first."""
+        baselines = self._baselines
+        if len(baselines) != num_channels or (num_channels > 1 and baselines[-2] != channel_spacing):
+            baselines = np.arange(num_channels - 1, -1, -1, dtype=np.float64) * channel_spacing
+            self._baselines = baselines
+        return baselines
     
     def _draw_annotations(self, ax, annotations: List[Annotation], 
                          window_start: float, window_size: float, channel_spacing: float) -> None:
         window_end = window_start + window_size
-        displayed_channel_names = [self.eeg_data.channel_names[i] for i in self.display_settings.selected_channels] or self.eeg_data.channel_names
+        displayed_channel_names = self._displayed_channel_names
         num_displayed_channels = len(displayed_channel_names)
+        name_to_index = {name: i for i, name in enumerate(displayed_channel_names)}
+        half_height = channel_spacing / 2
+
+        # Shapes are collected and submitted as one collection per style
+        global_lines, global_line_colors = [], []
+        channel_lines, channel_line_colors = [], []
+        global_spans, global_span_colors = [], []
+        channel_spans, channel_span_colors = [], []
 
         for annotation in annotations:
             # Punctual event (zero duration)
             if annotation.duration < 0.01:
                 if window_start <= annotation.start_time < window_end:
+                    x = annotation.start_time
                     if not annotation.channels: # Apply to all channels
-                        ax.axvline(x=annotation.start_time, color=annotation.color, linestyle='--', linewidth=1.5, zorder=1)
+                        global_lines.append([(x, 0), (x, 1)])
+                        global_line_colors.append(annotation.color)
                     else: # Apply to specific channels
                         for channel_name in annotation.channels:
-                            if channel_name in displayed_channel_names:
-                                try:
-                                    display_index = displayed_channel_names.index(channel_name)
-                                    y_pos = (num_displayed_channels - 1 - display_index) * channel_spacing
-                                    # Draw a short vertical line segment for the channel
-                                    ax.plot([annotation.start_time, annotation.start_time], 
-                                            [y_pos - channel_spacing / 2, y_pos + channel_spacing / 2],
-                                            color=annotation.color, linestyle='-', linewidth=2, zorder=1)
-                                except ValueError:
-                                    pass
+                            display_index = name_to_index.get(channel_name)
+                            if display_index is None:
+                                continue
+                            # Draw a short vertical line segment for the channel
+                            y_pos = (num_displayed_channels - 1 - display_index) * channel_spacing
+                            channel_lines.append([(x, y_pos - half_height), (x, y_pos + half_height)])
+                            channel_line_colors.append(annotation.color)
 
             # Ranged event
-            else:
+            elif annotation.start_time < window_end and annotation.end_time > window_start:
+                visible_start = max(annotation.start_time, window_start)
+                visible_end = min(annotation.end_time, window_end)
                 if not annotation.channels: # Annotation applies to all channels
-                    if annotation.start_time < window_end and annotation.end_time > window_start:
-                        visible_start = max(annotation.start_time, window_start)
-                        visible_end = min(annotation.end_time, window_end)
-                        ax.axvspan(visible_start, visible_end, color=annotation.color, alpha=0.2, zorder=0)
+                    global_spans.append([(visible_start, 0), (visible_end, 0), (visible_end, 1), (visible_start, 1)])
+                    global_span_colors.append(annotation.color)
                 else: # Annotation applies to specific channels
                     for channel_name in annotation.channels:
-                        if channel_name in displayed_channel_names:
-                            if annotation.start_time < window_end and annotation.end_time > window_start:
-                                visible_start = max(annotation.start_time, window_start)
-                                visible_end = min(annotation.end_time, window_end)
-                                try:
-                                    display_index = displayed_channel_names.index(channel_name)
-                                    y_pos = (num_displayed_channels - 1 - display_index) * channel_spacing
-                                    ax.axhspan(y_pos - channel_spacing / 2, y_pos + channel_spacing / 2, 
-                                              xmin=(visible_start - window_start) / window_size, 
-                                              xmax=(visible_end - window_start) / window_size, 
-                                              color=annotation.color, alpha=0.3, zorder=0)
-                                except ValueError:
-                                    pass
-    
-    def _draw_selection(self, ax, selection_state: SelectionState, 
-                       window_start: float, window_size: float) -> None:
+                        display_index = name_to_index.get(channel_name)
+                        if display_index is None:
+                            continue
+                        y_pos = (num_displayed_channels - 1 - display_index) * channel_spacing
+                        y0, y1 = y_pos - half_height, y_pos + half_height
+                        channel_spans.append([(visible_start, y0), (visible_end, y0), (visible_end, y1), (visible_start, y1)])
+                        channel_span_colors.append(annotation.color)
+
+        # Full-height shapes use x in data and y in axes coordinates
+        xaxis_transform = ax.get_xaxis_transform()
+        if global_spans:
+            self._frame_artists.append(ax.add_collection(PolyCollection(global_spans, facecolors=global_span_colors, edgecolors='none',
+                                             alpha=0.2, zorder=0, transform=xaxis_transform), autolim=False))
+        if channel_spans:
+            self._frame_artists.append(ax.add_collection(PolyCollection(channel_spans, facecolors=channel_span_colors, edgecolors='none',
+                                             alpha=0.3, zorder=0), autolim=False))
+        if global_lines:
+            self._frame_artists.append(ax.add_collection(LineCollection(global_lines, colors=global_line_colors, linestyles='--',
+                                             linewidths=1.5, zorder=1, transform=xaxis_transform), autolim=False))
+        if channel_lines:
+            self._frame_artists.append(ax.add_collection(LineCollection(channel_lines, colors=channel_line_colors, linestyles='-',
+                                             linewidths=2, zorder=1), autolim=False))
+
+    def _set_selection_extent(self, selection_state: SelectionState,
+                              window_start: float, window_size: float) -> None:
         if not selection_state.has_selection:
+            self._selection_patch.set_visible(False)
             return
         window_end = window_start + window_size
-        selection_start = max(selection_state.start_time, window_start)
-        selection_end = min(selection_state.end_time, window_end)
-        
-        if selection_start < selection_end:
-            # Muted yellow for selection
-            ax.axvspan(selection_start, selection_end, alpha=0.2, color='#F1C40F', zorder=10)
+        selection_start = max(min(selection_state.start_time, selection_state.end_time), window_start)
+        selection_end = min(max(selection_state.start_time, selection_state.end_time), window_end)
+        self._selection_patch.set_visible(selection_start < selection_end)
+        self._selection_patch.set_x(selection_start)
+        self._selection_patch.set_width(selection_end - selection_start)
+
+    def update_selection(self, selection_state: SelectionState) -> bool:
+        """
+        Redraw only the selection span on top of the cached background.
+
+        Returns False when no background is available yet and a full plot is needed.
+        """
+        if self._background is None or self._selection_patch is None:
+            return False
+        self._set_selection_extent(selection_state, *self._window)
+        self.canvas.restore_region(self._background)
+        self.figure.draw_artist(self._selection_patch)
+        self.canvas.blit(self.figure.bbox)
+        return True
     
     def clear(self):
         """Clear the current plot."""
+        self._background = None
+        self.ax = None
+        self.line_collection = None
+        self._selection_patch = None
+        self._frame_artists = []
+        self._ytick_key = None
+        self._displayed_channel_names = []
         self.figure.clear()
         self.canvas.draw()
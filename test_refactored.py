@@ -95,6 +95,145 @@ def test_annotation_manager():
         print(f"✗ Annotation manager test failed: {e}")
         return False
 
+def test_annotation_collection():
+    """Test annotation collection bulk operations."""
+    try:
+        from models import Annotation, AnnotationCollection
+        
+        collection = AnnotationCollection.create_empty("test.edf", 20.0, 250.0)
+        annotations = [Annotation.create(f"A{i}", float(i), float(i) + 1.0, "#E74C3C") for i in range(5)]
+        for annotation in annotations:
+            collection.add_annotation(annotation)
+        
+        # Test remove_many
+        collection.remove_many([annotations[1], annotations[3]])
+        remaining = collection.get_all_annotations()
+        assert [a.text for a in remaining] == ["A0", "A2", "A4"]
+        print("✓ AnnotationCollection.remove_many works correctly")
+        
+        # Test get uses start-time order
+        collection = AnnotationCollection.create_empty("test.edf", 20.0, 250.0)
+        late = Annotation.create("Late", 10.0, 11.0, "#E74C3C")
+        early = Annotation.create("Early", 0.5, 0.6, "#E74C3C")
+        collection.add_annotation(late)
+        collection.add_annotation(early)
+        assert collection.get(0) is early
+        assert collection.get(1) is late
+        print("✓ AnnotationCollection.get works correctly")
+        
+        # Test window culling (punctual events at the window start are kept)
+        marker = Annotation.create("Marker", 10.0, 10.0, "#3498DB")
+        collection.add_annotation(marker)
+        assert collection.get_annotations_in_range(10.0, 20.0) == [late, marker]
+        assert collection.get_annotations_in_range(0.0, 0.5) == []
+        assert collection.get_annotations_in_range(0.55, 5.0) == [early]
+        print("✓ AnnotationCollection.get_annotations_in_range works correctly")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ Annotation collection test failed: {e}")
+        return False
+
+def test_minmax_downsample():
+    """Test MinMax downsampling of window data."""
+    try:
+        import numpy as np
+        from plotting import minmax_downsample
+        
+        # Widths for whole bins and for a trailing partial bin
+        for num_samples, factor in [(1000, 10), (1003, 10), (7, 3)]:
+            data = np.zeros((2, num_samples))
+            result = minmax_downsample(data, factor)
+            assert result.shape == (2, 2 * -(-num_samples // factor))
+        print("✓ minmax_downsample returns two points per bin")
+        
+        # Spikes inside a bin, including the partial trailing one, are kept
+        data = np.zeros((2, 1003))
+        data[0, 457] = 5.0
+        data[1, 1001] = -3.0
+        result = minmax_downsample(data, 10)
+        assert result[0, 2 * 45 + 1] == 5.0
+        assert result[1, -2] == -3.0
+        assert result[0].max() == 5.0 and result[1].min() == -3.0
+        print("✓ minmax_downsample keeps spike peaks")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ MinMax downsample test failed: {e}")
+        return False
+
+def test_minmax_pyramid():
+    """Test that pyramid queries match the raw MinMax path."""
+    try:
+        import numpy as np
+        from plotting import MinMaxPyramid, minmax_downsample
+        
+        rng = np.random.default_rng(0)
+        data = rng.standard_normal((4, 100000))
+        pyramid = MinMaxPyramid(data)
+        raw32 = data.astype(np.float32)
+        
+        # Windows aligned to whole level cells give exactly the raw envelope
+        for stride, _, _ in pyramid.levels:
+            for factor in (1, 3):
+                decim = stride * factor
+                start, end = 7 * stride, 7 * stride + 20 * decim + 5
+                result = pyramid.query([0, 2], start, end, decim)
+                assert np.array_equal(result, minmax_downsample(raw32[[0, 2], start:end], decim))
+        print("✓ MinMaxPyramid.query matches minmax_downsample on aligned windows")
+        
+        # Unaligned windows are never wider than the raw path and use no samples outside the window
+        for decim, start, end in [(6, 0, 60000), (40, 0, 60000), (37, 1001, 55555), (300, 13, 99001)]:
+            result = pyramid.query(slice(None), start, end, decim)
+            assert result.shape[1] <= minmax_downsample(data[:, start:end], decim).shape[1]
+            window = raw32[:, start:end]
+            assert np.array_equal(result[:, 0::2].min(axis=1), window.min(axis=1))
+            assert np.array_equal(result[:, 1::2].max(axis=1), window.max(axis=1))
+        print("✓ MinMaxPyramid.query stays within the window and the raw width")
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ MinMax pyramid test failed: {e}")
+        return False
+
+def test_sosfiltfilt():
+    """Test the zero-phase filter against scipy.signal.sosfiltfilt."""
+    try:
+        import numpy as np
+        from scipy import signal
+        # Same module name as the app, so both share one Numba cache entry
+        from EEG_Annotation_Desktop__Application import utils_numba
+        from EEG_Annotation_Desktop__Application.file_handlers import _design_sos
+        
+        sos, zi = _design_sos(30.0, 1.0, 500.0)
+        rng = np.random.default_rng(0)
+        default_padlen = 3 * (2 * len(sos) + 1)
+        
+        numba_available = utils_numba.NUMBA_AVAILABLE
+        try:
+            # Both the Numba kernel (when installed) and the SciPy fallback
+            for use_numba in sorted({numba_available, False}, reverse=True):
+                utils_numba.NUMBA_AVAILABLE = use_numba
+                # A full window, and a short one where padlen is clamped to n - 1
+                for num_samples in (2000, 20):
+                    x = rng.standard_normal((8, num_samples))
+                    expected = signal.sosfiltfilt(sos, x, axis=-1, padlen=min(default_padlen, num_samples - 1))
+                    assert np.allclose(utils_numba.sosfiltfilt(sos, zi, x), expected, rtol=0, atol=1e-9)
+                    # A kernel failure falls back to SciPy; make sure the kernel really ran
+                    assert utils_numba.NUMBA_AVAILABLE == use_numba
+                print(f"✓ sosfiltfilt matches SciPy (Numba: {utils_numba.NUMBA_AVAILABLE})")
+        finally:
+            utils_numba.NUMBA_AVAILABLE = numba_available
+        
+        return True
+        
+    except Exception as e:
+        print(f"✗ sosfiltfilt test failed: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("Testing refactored EEG Dashboard...")
@@ -104,6 +243,10 @@ def main():
         ("Import Test", test_imports),
         ("Data Models Test", test_data_models),
         ("Annotation Manager Test", test_annotation_manager),
+        ("Annotation Collection Test", test_annotation_collection),
+        ("MinMax Downsample Test", test_minmax_downsample),
+        ("MinMax Pyramid Test", test_minmax_pyramid),
+        ("Zero-Phase Filter Test", test_sosfiltfilt),
     ]
     
     passed = 0
@@ -5,17 +5,49 @@ Professional UI update.
 
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QComboBox, QDialogButtonBox, QLabel, QLineEdit,
-    QDoubleSpinBox, QFormLayout, QMessageBox, QWidget, QCheckBox, QScrollArea,
-    QPushButton, QHBoxLayout, QGroupBox, QListWidget, QListWidgetItem, QGridLayout,
-    QSplitter, QFrame, QToolBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QDoubleSpinBox, QFormLayout, QWidget, QCheckBox, QScrollArea,
+    QPushButton, QHBoxLayout, QGroupBox, QGridLayout,
+    QSplitter, QFrame, QToolBox, QTableView, QListView, QHeaderView,
     QSlider, QStyle, QAbstractItemView, QSizePolicy, QSpacerItem, QToolButton
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QParallelAnimationGroup, QPropertyAnimation, QAbstractAnimation
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QSize, QParallelAnimationGroup, QPropertyAnimation, QAbstractAnimation,
+    QAbstractTableModel, QAbstractListModel, QModelIndex, QTimer, QStringListModel
+)
 from PyQt6.QtGui import QIcon
-from typing import List, Callable, Optional, Dict
+from functools import lru_cache, partial
+from typing import List, Callable, Optional, Dict, Tuple
+import numpy as np
 
 from EEG_Annotation_Desktop__Application.models import Annotation
 
+# 10-20 / 10-10 labels picked by the "Std" channel button, upper-cased for matching
+_STANDARD_CHANNELS_UPPER = frozenset({
+    'FP1', 'FP2', 'F3', 'F4', 'C3', 'C4', 'P3', 'P4', 'O1', 'O2', 'F7', 'F8', 'T3', 'T4', 'T5', 'T6',
+    'FZ', 'CZ', 'PZ', 'T7', 'T8', 'P7', 'P8', 'FC1', 'FC2', 'CP1', 'CP2'
+})
+_STANDARD_CHANNELS_UPPER_ARR = np.array(sorted(_STANDARD_CHANNELS_UPPER))
+
+
+@lru_cache(maxsize=None)
+def _std_icon(style: QStyle, pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Return the style's standard icon, rendered once per style and pixmap."""
+    return style.standardIcon(pixmap)
+
+
+# Label models shared by every annotation dialog, keyed by the label list
+_PREDEFINED_MODEL_CACHE: Dict[Tuple[str, ...], QStringListModel] = {}
+
+
+def _get_predefined_model(predefined_annotations: List[str]) -> QStringListModel:
+    """Return the shared combobox model for a list of predefined labels."""
+    key = tuple(predefined_annotations)
+    model = _PREDEFINED_MODEL_CACHE.get(key)
+    if model is None:
+        model = QStringListModel(list(key))
+        _PREDEFINED_MODEL_CACHE[key] = model
+    return model
+
 
 class AnnotationDialog(QDialog):
     """Dialog for selecting or entering an annotation label."""
@@ -25,9 +57,10 @@ class AnnotationDialog(QDialog):
         self.setWindowTitle("Add Annotation")
         self.setMinimumWidth(350)
         self.result: Optional[str] = None
-        self._setup_ui(predefined_annotations)
+        self._setup_ui()
+        self.reset(predefined_annotations)
 
-    def _setup_ui(self, predefined_annotations):
+    def _setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
 
@@ -35,9 +68,9 @@ class AnnotationDialog(QDialog):
         layout.addWidget(label)
 
         self.combobox = QComboBox(self)
-        self.combobox.addItems(predefined_annotations)
         self.combobox.setEditable(True)
-        self.combobox.setEditText("Seizure")
+        # Typed labels must not be inserted into the shared model
+        self.combobox.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         layout.addWidget(self.combobox)
 
         self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -45,12 +78,24 @@ class AnnotationDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addWidget(self.button_box)
 
+        # OK stays disabled while the label is blank instead of warning after the click
+        self.ok_button = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
+        self.combobox.editTextChanged.connect(self._update_ok_button)
+
+    def _update_ok_button(self, text: str):
+        self.ok_button.setEnabled(bool(text.strip()))
+
     def accept(self):
         self.result = self.combobox.currentText().strip()
         if self.result:
             super().accept()
-        else:
-            QMessageBox.warning(self, "Input Required", "Please select or enter an annotation.")
+
+    def reset(self, predefined_annotations: List[str]):
+        """Restore the initial state so the dialog can be shown again."""
+        self.result = None
+        self.combobox.setModel(_get_predefined_model(predefined_annotations))
+        self.combobox.setEditText("Seizure")
+        self._update_ok_button(self.combobox.currentText())
 
     def get_result(self) -> Optional[str]:
         return self.result
@@ -59,33 +104,29 @@ class AnnotationDialog(QDialog):
 class EditAnnotationDialog(QDialog):
     """Dialog for editing an annotation label and time range."""
 
-    def __init__(self, parent: QWidget, annotation: Annotation, predefined_annotations: List[str]):
+    def __init__(self, parent: QWidget, annotation: Annotation, predefined_annotations: List[str],
+                 max_time: Optional[float] = None):
         super().__init__(parent)
         self.setWindowTitle("Edit Annotation")
         self.setMinimumWidth(350)
         self.result: Optional[dict] = None
-        self.annotation = annotation
-        self._setup_ui(predefined_annotations)
+        self._setup_ui()
+        self.reset(annotation, predefined_annotations, max_time)
 
-    def _setup_ui(self, predefined_annotations):
+    def _setup_ui(self):
         layout = QFormLayout(self)
         layout.setSpacing(10)
 
         self.combo_var = QComboBox(self)
-        self.combo_var.addItems(predefined_annotations)
         self.combo_var.setEditable(True)
-        self.combo_var.setCurrentText(self.annotation.text)
+        self.combo_var.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         layout.addRow("Label:", self.combo_var)
 
         self.start_time_spinbox = QDoubleSpinBox(self)
-        self.start_time_spinbox.setRange(0, 999999)
-        self.start_time_spinbox.setValue(self.annotation.start_time)
         self.start_time_spinbox.setDecimals(3)
         layout.addRow("Start (s):", self.start_time_spinbox)
 
         self.end_time_spinbox = QDoubleSpinBox(self)
-        self.end_time_spinbox.setRange(0, 999999)
-        self.end_time_spinbox.setValue(self.annotation.end_time)
         self.end_time_spinbox.setDecimals(3)
         layout.addRow("End (s):", self.end_time_spinbox)
 
@@ -94,19 +135,26 @@ class EditAnnotationDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         layout.addRow(self.button_box)
 
+        # OK is only enabled for a non-blank label and start <= end
+        self.ok_button = self.button_box.button(QDialogButtonBox.StandardButton.Ok)
+        self.combo_var.editTextChanged.connect(self._update_ok_button)
+        self.start_time_spinbox.valueChanged.connect(self._update_ok_button)
+        self.end_time_spinbox.valueChanged.connect(self._update_ok_button)
+
+    def _is_valid(self) -> bool:
+        return (bool(self.combo_var.currentText().strip())
+                and self.start_time_spinbox.value() <= self.end_time_spinbox.value())
+
+    def _update_ok_button(self, *_):
+        self.ok_button.setEnabled(self._is_valid())
+
     def accept(self):
-        label = self.combo_var.currentText().strip()
-        if not label:
-            QMessageBox.warning(self, "Input Required", "Please enter an annotation label.")
+        if not self._is_valid():
             return
-
+        label = self.combo_var.currentText().strip()
         start_time = self.start_time_spinbox.value()
         end_time = self.end_time_spinbox.value()
 
-        if start_time > end_time:
-            QMessageBox.warning(self, "Invalid Input", "Start time must be less than or equal to end time.")
-            return
-
         self.result = {
             "text": label,
             "start_time": start_time,
@@ -114,19 +162,65 @@ class EditAnnotationDialog(QDialog):
         }
         super().accept()
 
+    def reset(self, annotation: Annotation, predefined_annotations: List[str],
+              max_time: Optional[float] = None):
+        """Load another annotation into the dialog so it can be shown again.
+
+        The time spin boxes are bounded by max_time (normally the recording length);
+        without one they fall back to ten times the annotation's end time.
+        """
+        self.result = None
+        self.annotation = annotation
+        self.combo_var.setModel(_get_predefined_model(predefined_annotations))
+        self.combo_var.setCurrentText(annotation.text)
+        if max_time is None:
+            max_time = annotation.end_time * 10
+        max_time = max(max_time, annotation.end_time, 1.0)
+        self.start_time_spinbox.setRange(0, max_time)
+        self.end_time_spinbox.setRange(0, max_time)
+        self.start_time_spinbox.setValue(annotation.start_time)
+        self.end_time_spinbox.setValue(annotation.end_time)
+        self._update_ok_button()
+
     def get_result(self) -> Optional[dict]:
         return self.result
 
 
+def get_annotation_dialog(parent: QWidget, predefined_annotations: List[str]) -> AnnotationDialog:
+    """Return the parent's reusable AnnotationDialog, reset for a new annotation."""
+    dialog = getattr(parent, "_annotation_dialog", None)
+    if dialog is None:
+        dialog = AnnotationDialog(parent, predefined_annotations)
+        parent._annotation_dialog = dialog
+    else:
+        dialog.reset(predefined_annotations)
+    return dialog
+
+
+def get_edit_annotation_dialog(parent: QWidget, annotation: Annotation,
+                               predefined_annotations: List[str],
+                               max_time: Optional[float] = None) -> EditAnnotationDialog:
+    """Return the parent's reusable EditAnnotationDialog, loaded with the given annotation."""
+    dialog = getattr(parent, "_edit_annotation_dialog", None)
+    if dialog is None:
+        dialog = EditAnnotationDialog(parent, annotation, predefined_annotations, max_time)
+        parent._edit_annotation_dialog = dialog
+    else:
+        dialog.reset(annotation, predefined_annotations, max_time)
+    return dialog
+
+
 class CollapsibleBox(QWidget):
     """A custom collapsible box widget."""
     def __init__(self, title="", parent=None):
         super().__init__(parent)
         self.toggle_button = QToolButton(text=title, checkable=True, checked=False)
-        self.toggle_button.setStyleSheet("QToolButton { border: none; font-weight: bold; text-align: left; padding: 5px; background-color: #f8f9fa; border-radius: 4px; } QToolButton:hover { background-color: #e9ecef; }")
+        # Styled by the window stylesheet; per-widget sheets are re-resolved on every polish
+        self.toggle_button.setObjectName("collapsibleToggle")
         self.toggle_button.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.toggle_button.setArrowType(Qt.ArrowType.RightArrow)
         self.toggle_button.pressed.connect(self.on_pressed)
+        self._content_builder = None
 
         self.content_area = QWidget()
         self.content_area.setMaximumHeight(0)
@@ -146,6 +240,12 @@ class CollapsibleBox(QWidget):
 
     def on_pressed(self):
         checked = self.toggle_button.isChecked()
+        if self._content_builder is not None:
+            builder, self._content_builder = self._content_builder, None
+            self.setContentLayout(builder())
+            # Widgets laid into an already visible parent stay hidden until shown
+            for child in self.content_area.findChildren(QWidget, options=Qt.FindChildOption.FindDirectChildrenOnly):
+                child.show()
         self.toggle_button.setArrowType(Qt.ArrowType.DownArrow if not checked else Qt.ArrowType.RightArrow)
         self.anim.setDirection(QAbstractAnimation.Direction.Forward if not checked else QAbstractAnimation.Direction.Backward)
         
@@ -156,12 +256,72 @@ class CollapsibleBox(QWidget):
 
     def setContentLayout(self, layout):
         self.content_area.setLayout(layout)
+
+    def setContentBuilder(self, builder):
+        """Defer creating the content until the box is first expanded; builder returns the layout."""
+        self._content_builder = builder
         
     def expand(self):
         if not self.toggle_button.isChecked():
             self.toggle_button.click()
 
 
+class ChannelListModel(QAbstractListModel):
+    """Checkable channel rows backed by parallel arrays: row labels and a boolean check mask."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._labels: List[str] = []
+        self._checked = np.zeros(0, dtype=bool)
+
+    def set_channels(self, channel_names: List[str]):
+        """Replace the rows with the given channels, all checked."""
+        self.beginResetModel()
+        self._labels = [f"{i+1}. {name}" for i, name in enumerate(channel_names)]
+        self._checked = np.ones(len(channel_names), dtype=bool)
+        self.endResetModel()
+
+    def checked_indices(self) -> List[int]:
+        return np.flatnonzero(self._checked).tolist()
+
+    def set_all(self, checked: bool):
+        """Check or uncheck every row with a single change notification."""
+        self._checked[:] = checked
+        self._emit_check_states_changed()
+
+    def set_checked(self, mask: np.ndarray):
+        """Replace the check states from a boolean mask, one entry per row."""
+        self._checked[:] = mask
+        self._emit_check_states_changed()
+
+    def _emit_check_states_changed(self):
+        if len(self._labels):
+            self.dataChanged.emit(self.index(0), self.index(len(self._labels) - 1),
+                                  [Qt.ItemDataRole.CheckStateRole])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._labels[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return Qt.CheckState.Checked if self._checked[index.row()] else Qt.CheckState.Unchecked
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if index.isValid() and role == Qt.ItemDataRole.CheckStateRole:
+            self._checked[index.row()] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+
 class LeftSidebarWidget(QWidget):
     """Left sidebar with file, channel, filter, and display settings."""
 
@@ -180,7 +340,9 @@ class LeftSidebarWidget(QWidget):
         self.on_theme_change = on_theme_change
         
         self.channel_names = []
-        self.channel_checkboxes = []
+        self._channel_names_upper = []
+        self.channel_list = None
+        self.lp_spin = None
         self.amplitude_values = [0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0]
 
         self.setMinimumWidth(280)
@@ -212,7 +374,8 @@ class LeftSidebarWidget(QWidget):
         load_btn.setObjectName("primaryButton")
         load_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         load_btn.setMinimumHeight(32)
-        load_btn.clicked.connect(lambda: self.on_load_file())
+        # Wrapped because clicked's checked flag would otherwise land in the loader's file_path
+        load_btn.clicked.connect(lambda _=False: self.on_load_file())
         file_layout.addWidget(load_btn)
         
         # File Info Card
@@ -227,6 +390,10 @@ class LeftSidebarWidget(QWidget):
         self.lbl_duration = QLabel("-")
         self.lbl_sfreq = QLabel("-")
         self.lbl_channels = QLabel("-")
+        # Values are set from file metadata; plain text skips Qt's rich-text sniffing on
+        # every update and shows names containing '<' or '&' literally
+        for lbl in (self.lbl_filename, self.lbl_duration, self.lbl_sfreq, self.lbl_channels):
+            lbl.setTextFormat(Qt.TextFormat.PlainText)
         
         info_layout.addRow("File:", self.lbl_filename)
         info_layout.addRow("Duration:", self.lbl_duration)
@@ -240,7 +407,26 @@ class LeftSidebarWidget(QWidget):
         self.content_layout.addWidget(self.file_box)
 
         # --- B. Channel Settings ---
+        # Collapsed sections are only built when first expanded
         self.channel_box = CollapsibleBox("Channels")
+        self.channel_box.setContentBuilder(self._build_channel_section)
+        self.content_layout.addWidget(self.channel_box)
+
+        # --- C. Filter Settings ---
+        self.filter_box = CollapsibleBox("Filters")
+        self.filter_box.setContentBuilder(self._build_filter_section)
+        self.content_layout.addWidget(self.filter_box)
+
+        # --- D. Display Settings ---
+        # Open by default, but built on the first event-loop tick so the window paints sooner
+        self.display_box = CollapsibleBox("Display")
+        self.display_box.setContentBuilder(self._build_display_section)
+        self.content_layout.addWidget(self.display_box)
+        QTimer.singleShot(0, self.display_box.expand)
+        
+        self.content_layout.addStretch()
+
+    def _build_channel_section(self) -> QVBoxLayout:
         channel_layout = QVBoxLayout()
         channel_layout.setContentsMargins(5, 10, 5, 10)
         
@@ -252,15 +438,15 @@ class LeftSidebarWidget(QWidget):
             btn_layout.addWidget(btn)
         channel_layout.addLayout(btn_layout)
 
-        self.channel_scroll = QScrollArea()
-        self.channel_scroll.setWidgetResizable(True)
-        self.channel_scroll.setFrameShape(QFrame.Shape.NoFrame)
-        self.channel_scroll.setMinimumHeight(150)
-        self.channel_content = QWidget()
-        self.channel_list_layout = QVBoxLayout(self.channel_content)
-        self.channel_list_layout.setSpacing(2)
-        self.channel_scroll.setWidget(self.channel_content)
-        channel_layout.addWidget(self.channel_scroll)
+        # A list view over a mask-backed model instead of a QCheckBox widget per channel
+        self.channel_model = ChannelListModel(self)
+        self.channel_list = QListView()
+        self.channel_list.setModel(self.channel_model)
+        self.channel_list.setFrameShape(QFrame.Shape.NoFrame)
+        self.channel_list.setMinimumHeight(150)
+        self.channel_list.setUniformItemSizes(True)
+        self.channel_list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        channel_layout.addWidget(self.channel_list)
         
         apply_channels_btn = QPushButton("Apply Selection")
         apply_channels_btn.setObjectName("primaryButton")
@@ -268,11 +454,10 @@ class LeftSidebarWidget(QWidget):
         apply_channels_btn.clicked.connect(self._apply_channel_selection)
         channel_layout.addWidget(apply_channels_btn)
 
-        self.channel_box.setContentLayout(channel_layout)
-        self.content_layout.addWidget(self.channel_box)
+        self._populate_channel_list()
+        return channel_layout
 
-        # --- C. Filter Settings ---
-        self.filter_box = CollapsibleBox("Filters")
+    def _build_filter_section(self) -> QFormLayout:
         filter_layout = QFormLayout()
         filter_layout.setContentsMargins(5, 10, 5, 10)
         filter_layout.setSpacing(10)
@@ -301,11 +486,9 @@ class LeftSidebarWidget(QWidget):
         btn_filter_layout.addWidget(reset_filter_btn)
         filter_layout.addRow(btn_filter_layout)
         
-        self.filter_box.setContentLayout(filter_layout)
-        self.content_layout.addWidget(self.filter_box)
+        return filter_layout
 
-        # --- D. Display Settings ---
-        self.display_box = CollapsibleBox("Display")
+    def _build_display_section(self) -> QFormLayout:
         display_layout = QFormLayout()
         display_layout.setContentsMargins(5, 10, 5, 10)
         display_layout.setSpacing(10)
@@ -313,7 +496,8 @@ class LeftSidebarWidget(QWidget):
         self.time_scale_combo = QComboBox()
         self.time_scale_combo.addItems(["5", "10", "20", "30", "60"])
         self.time_scale_combo.setCurrentText("20")
-        self.time_scale_combo.currentTextChanged.connect(self._on_time_scale_change)
+        # textActivated only fires on user picks, so programmatic setCurrentText never replots
+        self.time_scale_combo.textActivated.connect(self._on_time_scale_change)
         display_layout.addRow("Window (s):", self.time_scale_combo)
 
         self.amp_slider = QSlider(Qt.Orientation.Horizontal)
@@ -321,22 +505,23 @@ class LeftSidebarWidget(QWidget):
         self.amp_slider.setValue(3)
         self.amp_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.amp_slider.setTickInterval(1)
+        # Without tracking, dragging only updates the readout and the plot is rescaled once
+        # on release; keyboard and wheel steps still apply immediately
+        self.amp_slider.setTracking(False)
+        self.amp_slider.sliderMoved.connect(self._update_amplitude_label)
         self.amp_slider.valueChanged.connect(self._on_amplitude_slider_change)
         
         self.lbl_amp_value = QLabel("1.0 µV")
+        self.lbl_amp_value.setTextFormat(Qt.TextFormat.PlainText)
         self.lbl_amp_value.setAlignment(Qt.AlignmentFlag.AlignRight)
         display_layout.addRow("Amplitude:", self.lbl_amp_value)
         display_layout.addRow(self.amp_slider)
 
         self.theme_check = QCheckBox("Dark Mode")
-        self.theme_check.toggled.connect(self.on_theme_change)
+        # clicked only fires on user action, so syncing the box in code does not re-theme the window
+        self.theme_check.clicked.connect(self.on_theme_change)
         display_layout.addRow(self.theme_check)
-        
-        self.display_box.setContentLayout(display_layout)
-        self.display_box.expand() # Expand by default
-        self.content_layout.addWidget(self.display_box)
-        
-        self.content_layout.addStretch()
+        return display_layout
 
     def update_file_info(self, filename: str, duration: float, sfreq: float, n_channels: int, channel_names: List[str]):
         self.lbl_filename.setText(filename)
@@ -344,41 +529,36 @@ class LeftSidebarWidget(QWidget):
         self.lbl_sfreq.setText(f"{sfreq} Hz")
         self.lbl_channels.setText(f"{n_channels}")
         self.channel_names = channel_names
+        self._channel_names_upper = np.array([name.upper() for name in channel_names])
         self._populate_channel_list()
 
     def _populate_channel_list(self):
-        while self.channel_list_layout.count():
-            item = self.channel_list_layout.takeAt(0)
-            if item.widget(): item.widget().deleteLater()
-        self.channel_checkboxes = []
-        for i, name in enumerate(self.channel_names):
-            cb = QCheckBox(f"{i+1}. {name}")
-            cb.setChecked(True)
-            self.channel_checkboxes.append(cb)
-            self.channel_list_layout.addWidget(cb)
+        if self.channel_list is None:  # section not built yet; it populates itself when expanded
+            return
+        self.channel_model.set_channels(self.channel_names)
 
     def _select_all_channels(self):
-        for cb in self.channel_checkboxes: cb.setChecked(True)
+        self.channel_model.set_all(True)
 
     def _deselect_all_channels(self):
-        for cb in self.channel_checkboxes: cb.setChecked(False)
+        self.channel_model.set_all(False)
 
     def _select_standard_channels(self):
-        std = ['FP1', 'FP2', 'F3', 'F4', 'C3', 'C4', 'P3', 'P4', 'O1', 'O2', 'F7', 'F8', 'T3', 'T4', 'T5', 'T6', 'FZ', 'CZ', 'PZ', 'T7', 'T8', 'P7', 'P8', 'FC1', 'FC2', 'CP1', 'CP2']
-        for i, name in enumerate(self.channel_names):
-            self.channel_checkboxes[i].setChecked(name.upper() in std)
+        self.channel_model.set_checked(np.isin(self._channel_names_upper, _STANDARD_CHANNELS_UPPER_ARR))
 
     def _apply_channel_selection(self):
-        self.on_channel_selection_change([i for i, cb in enumerate(self.channel_checkboxes) if cb.isChecked()])
+        self.on_channel_selection_change(self.channel_model.checked_indices())
 
     def _on_time_scale_change(self, value: str):
         try: self.on_time_scale_change(float(value))
         except: pass
 
+    def _update_amplitude_label(self, value: int):
+        self.lbl_amp_value.setText(f"{self.amplitude_values[value]} µV")
+
     def _on_amplitude_slider_change(self, value: int):
-        val = self.amplitude_values[value]
-        self.lbl_amp_value.setText(f"{val} µV")
-        self.on_amplitude_scale_change(val)
+        self._update_amplitude_label(value)
+        self.on_amplitude_scale_change(self.amplitude_values[value])
 
     def _on_filter_change(self):
         lp = self.lp_spin.value()
@@ -386,9 +566,10 @@ class LeftSidebarWidget(QWidget):
         self.on_filter_change(None if lp == 0 else lp, None if hp == 0 else hp, self.notch_check.isChecked())
 
     def reset_filters(self):
-        self.lp_spin.setValue(0)
-        self.hp_spin.setValue(0)
-        self.notch_check.setChecked(False)
+        if self.lp_spin is not None:
+            self.lp_spin.setValue(0)
+            self.hp_spin.setValue(0)
+            self.notch_check.setChecked(False)
         self.on_filter_change(None, None, False)
 
 
@@ -411,14 +592,16 @@ class NavigationWidget(QWidget):
             (QStyle.StandardPixmap.SP_MediaSeekBackward, "Previous Window", "previous")
         ]:
             btn = QPushButton()
-            btn.setIcon(self.style().standardIcon(icon))
+            btn.setIcon(_std_icon(self.style(), icon))
             btn.setToolTip(tooltip)
             btn.setFixedSize(32, 32)
-            btn.clicked.connect(lambda _, a=action: self.on_navigation(a))
+            btn.clicked.connect(partial(self.on_navigation, action))
             layout.addWidget(btn)
         
+        self._play_icon = _std_icon(self.style(), QStyle.StandardPixmap.SP_MediaPlay)
+        self._pause_icon = _std_icon(self.style(), QStyle.StandardPixmap.SP_MediaPause)
         self.play_btn = QPushButton()
-        self.play_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.play_btn.setIcon(self._play_icon)
         self.play_btn.setToolTip("Play / Pause")
         self.play_btn.setFixedSize(32, 32)
         self.play_btn.setCheckable(True)
@@ -430,21 +613,141 @@ class NavigationWidget(QWidget):
             (QStyle.StandardPixmap.SP_MediaSkipForward, "Last", "last")
         ]:
             btn = QPushButton()
-            btn.setIcon(self.style().standardIcon(icon))
+            btn.setIcon(_std_icon(self.style(), icon))
             btn.setToolTip(tooltip)
             btn.setFixedSize(32, 32)
-            btn.clicked.connect(lambda _, a=action: self.on_navigation(a))
+            btn.clicked.connect(partial(self.on_navigation, action))
             layout.addWidget(btn)
         
         layout.addStretch()
 
     def _toggle_play(self):
         self.is_playing = not self.is_playing
-        icon = QStyle.StandardPixmap.SP_MediaPause if self.is_playing else QStyle.StandardPixmap.SP_MediaPlay
-        self.play_btn.setIcon(self.style().standardIcon(icon))
+        self.play_btn.setIcon(self._pause_icon if self.is_playing else self._play_icon)
         self.on_navigation("play" if self.is_playing else "pause")
 
 
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_STATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_USER_ROLE = Qt.ItemDataRole.UserRole
+_format_seconds = "{:.2f}".format
+
+
+class AnnotationTableModel(QAbstractTableModel):
+    """Table model over the visible annotations: a checkbox column, then label, start and duration."""
+
+    HEADERS = ["", "Label", "Start", "Dur"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (index in the full annotation list, annotation)
+        self._checked = []
+        self._checked_count = 0  # lets checked_indices skip the row scan when nothing is ticked
+        self._display = []  # per-row (label, start, duration) strings, filled on first paint
+
+    def set_annotations(self, rows: List[tuple]):
+        """
+        Replace the displayed rows; each row is (original index, Annotation).
+
+        Rows whose annotation is unchanged at the head and tail of the list are kept, so
+        adding, deleting or filtering only inserts/removes the differing middle block and
+        check states of the kept rows survive the refresh.
+        """
+        old = self._rows
+        old_count, new_count = len(old), len(rows)
+        limit = min(old_count, new_count)
+        prefix = 0
+        while prefix < limit and old[prefix][1] is rows[prefix][1]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[old_count - 1 - suffix][1] is rows[new_count - 1 - suffix][1]:
+            suffix += 1
+        old_end, new_end = old_count - suffix, new_count - suffix
+
+        checked = self._checked
+        if old_end > prefix:
+            self.beginRemoveRows(QModelIndex(), prefix, old_end - 1)
+            self._rows = old[:prefix] + old[old_end:]
+            self._checked_count -= sum(checked[prefix:old_end])
+            checked = self._checked = checked[:prefix] + checked[old_end:]
+            self._display = [None] * len(self._rows)
+            self.endRemoveRows()
+        if new_end > prefix:
+            self.beginInsertRows(QModelIndex(), prefix, new_end - 1)
+            self._rows = rows
+            self._checked = checked[:prefix] + [False] * (new_end - prefix) + checked[prefix:]
+            self._display = [None] * new_count
+            self.endInsertRows()
+
+        # Kept rows may carry new original indices or edited labels/times
+        self._rows = rows
+        self._display = [None] * new_count
+        if new_count:
+            self.dataChanged.emit(self.index(0, 1), self.index(new_count - 1, len(self.HEADERS) - 1),
+                                  [_DISPLAY_ROLE, _USER_ROLE])
+
+    def original_index(self, row: int) -> int:
+        return self._rows[row][0]
+
+    def checked_indices(self) -> List[int]:
+        if not self._checked_count:
+            return []
+        return [self._rows[row][0] for row, checked in enumerate(self._checked) if checked]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            if role == _CHECK_STATE_ROLE:
+                return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+            return None
+        if role == _DISPLAY_ROLE:
+            # Formatted once per row; the view asks again on every repaint and scroll
+            strings = self._display[row]
+            if strings is None:
+                ann = self._rows[row][1]
+                strings = self._display[row] = (
+                    ann.text, _format_seconds(ann.start_time), _format_seconds(ann.duration))
+            return strings[column - 1]
+        if role == _EDIT_ROLE:
+            # Raw values, so sorting (e.g. through a proxy's default sort role) is numeric
+            ann = self._rows[row][1]
+            return ann.text if column == 1 else ann.start_time if column == 2 else ann.duration
+        if role == _USER_ROLE:
+            return self._rows[row][0]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if index.isValid() and index.column() == 0 and role == Qt.ItemDataRole.CheckStateRole:
+            row = index.row()
+            checked = Qt.CheckState(value) == Qt.CheckState.Checked
+            self._checked_count += checked - self._checked[row]
+            self._checked[row] = checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == 0:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+
 class AnnotationPanel(QWidget):
     """Panel for annotation controls and display."""
 
@@ -461,6 +764,15 @@ class AnnotationPanel(QWidget):
         self.on_load_annotations = on_load_annotations
         self.on_edit_annotation = on_edit_annotation
         self.on_jump_to_annotation = on_jump_to_annotation
+        self._all_annotations: List[Annotation] = []
+        self._lc_texts: List[str] = []
+        self._applied_filter = ""
+
+        # Typing restarts the timer, so the table is refiltered once the user pauses
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._do_filter)
         
         self.setMinimumWidth(280)
         self.setMaximumWidth(320)
@@ -474,7 +786,6 @@ class AnnotationPanel(QWidget):
         # Header
         header = QLabel("Annotations")
         header.setObjectName("panelHeader")
-        header.setStyleSheet("font-size: 14px; font-weight: bold; color: #2c3e50;")
         layout.addWidget(header)
 
         # A. Actions
@@ -496,24 +807,28 @@ class AnnotationPanel(QWidget):
         # B. Filter & List
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("🔍 Filter annotations...")
-        self.search_input.textChanged.connect(self._filter_annotations)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         layout.addWidget(self.search_input)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4) # Added column for checkbox
-        self.table.setHorizontalHeaderLabels(["", "Label", "Start", "Dur"])
+        # A view over a model reading the annotations directly; no item objects per cell
+        self.table_model = AnnotationTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
+        # Fit the content-sized columns to the visible rows only; by default Qt measures up to
+        # 1000 rows through data() on every refresh, i.e. every navigation step
+        self.table.horizontalHeader().setResizeContentsPrecision(0)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(False)
         self.table.setAlternatingRowColors(True)
-        self.table.cellDoubleClicked.connect(self.on_edit_annotation)
-        self.table.itemClicked.connect(self._on_table_item_clicked)
+        self.table.doubleClicked.connect(self._on_table_double_clicked)
+        self.table.clicked.connect(self._on_table_clicked)
         layout.addWidget(self.table)
 
         # C. File Operations
@@ -537,39 +852,33 @@ class AnnotationPanel(QWidget):
         pass
 
     def update_annotations_display(self, annotations: List[Annotation]):
-        self.table.setRowCount(0)
+        # The full list is kept so search edits refilter locally
+        self._all_annotations = annotations
+        # Lower-cased once per list (the main window pushes a new list after every add, delete
+        # or edit), so search keystrokes do not re-lower every label
+        self._lc_texts = [ann.text.lower() for ann in annotations]
+        self._apply_filter()
+
+    def _apply_filter(self):
+        annotations = self._all_annotations
         filter_text = self.search_input.text().lower()
-        row = 0
-        for i, ann in enumerate(annotations):
-            if filter_text and filter_text not in ann.text.lower(): continue
-            self.table.insertRow(row)
-            
-            # Checkbox item
-            chk_item = QTableWidgetItem()
-            chk_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            chk_item.setCheckState(Qt.CheckState.Unchecked)
-            self.table.setItem(row, 0, chk_item)
-            
-            self.table.setItem(row, 1, QTableWidgetItem(ann.text))
-            self.table.setItem(row, 2, QTableWidgetItem(f"{ann.start_time:.2f}"))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{ann.duration:.2f}"))
-            self.table.item(row, 1).setData(Qt.ItemDataRole.UserRole, i) # Store index in label column
-            row += 1
+        self._applied_filter = filter_text
+        if not filter_text:
+            visible = list(enumerate(annotations))
+        else:
+            lc_texts = self._lc_texts
+            visible = [(i, ann) for i, ann in enumerate(annotations) if filter_text in lc_texts[i]]
+        self.table_model.set_annotations(visible)
 
     def get_selected_annotation_indices(self) -> List[int]:
         """Get indices of all selected annotations (checked or highlighted)."""
-        indices = []
-        
-        # Check for checked items
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 0).checkState() == Qt.CheckState.Checked:
-                indices.append(self.table.item(row, 1).data(Qt.ItemDataRole.UserRole))
+        indices = self.table_model.checked_indices()
         
         # If no checkboxes are checked, use the highlighted row
         if not indices:
-            row = self.table.currentRow()
+            row = self.table.currentIndex().row()
             if row >= 0:
-                indices.append(self.table.item(row, 1).data(Qt.ItemDataRole.UserRole))
+                indices.append(self.table_model.original_index(row))
                 
         return indices
 
@@ -578,14 +887,19 @@ class AnnotationPanel(QWidget):
         indices = self.get_selected_annotation_indices()
         return indices[0] if indices else None
 
-    def _on_table_item_clicked(self, item):
+    def _on_table_clicked(self, index: QModelIndex):
         # Only jump if not clicking the checkbox column
-        if item.column() > 0:
-            idx = self.table.item(item.row(), 1).data(Qt.ItemDataRole.UserRole)
-            self.on_jump_to_annotation(idx)
+        if index.column() > 0:
+            self.on_jump_to_annotation(self.table_model.original_index(index.row()))
 
-    def _filter_annotations(self):
-        pass
+    def _on_table_double_clicked(self, index: QModelIndex):
+        self.on_edit_annotation(index.row(), index.column())
+
+    def _do_filter(self):
+        # Text edited back to what is already shown (e.g. typed then erased): nothing to redo
+        if self.search_input.text().lower() == self._applied_filter:
+            return
+        self._apply_filter()
 
     def is_annotation_mode_enabled(self) -> bool:
         return True
@@ -0,0 +1,114 @@
+"""
+Numba kernels for the numeric hot paths, with NumPy fallbacks when Numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # optional, the NumPy versions below are used instead
+    NUMBA_AVAILABLE = False
+
+
+def _disable_numba(error: Exception) -> None:
+    """
+    Switch to the NumPy/SciPy paths after a kernel fails to dispatch.
+
+    A stale on-disk cache (e.g. written when this module was imported under another
+    name) makes every call raise, so the kernels are not retried for the session.
+    """
+    global NUMBA_AVAILABLE
+    NUMBA_AVAILABLE = False
+    print(f"Numba kernel error, falling back to NumPy/SciPy: {error}")
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _channel_stds_numba(data):
+        num_channels, num_samples = data.shape
+        out = np.empty(num_channels)
+        for i in prange(num_channels):
+            s = 0.0
+            s2 = 0.0
+            for j in range(num_samples):
+                v = data[i, j]
+                s += v
+                s2 += v * v
+            mean = s / num_samples
+            out[i] = np.sqrt(max(s2 / num_samples - mean * mean, 0.0))
+        return out
+
+
+def channel_stds(data: np.ndarray) -> np.ndarray:
+    """
+    Per-channel standard deviation of a (n_channels, n_samples) array.
+
+    The Numba kernel accumulates sum and sum of squares in a single pass per row.
+    """
+    if data.shape[1] == 0:
+        return np.zeros(data.shape[0])
+    if NUMBA_AVAILABLE:
+        try:
+            return _channel_stds_numba(np.ascontiguousarray(data))
+        except Exception as e:
+            _disable_numba(e)
+    return np.std(data, axis=1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _sosfilt_batch(sos, zi, x, out):
+        num_channels, num_samples = x.shape
+        for c in prange(num_channels):
+            x0 = x[c, 0]
+            for n in range(num_samples):
+                out[c, n] = x[c, n]
+            for k in range(sos.shape[0]):
+                b0, b1, b2 = sos[k, 0], sos[k, 1], sos[k, 2]
+                a1, a2 = sos[k, 4], sos[k, 5]
+                z1 = zi[k, 0] * x0
+                z2 = zi[k, 1] * x0
+                for n in range(num_samples):
+                    v = out[c, n]
+                    y = b0 * v + z1
+                    z1 = b1 * v - a1 * y + z2
+                    z2 = b2 * v - a2 * y
+                    out[c, n] = y
+
+
+def sosfiltfilt(sos: np.ndarray, zi: np.ndarray, data: np.ndarray) -> np.ndarray:
+    """
+    Zero-phase second-order-sections filter along the last axis of a 2D array.
+
+    Mirrors scipy.signal.sosfiltfilt (odd-extension padding, steady-state initial
+    conditions from sosfilt_zi); the Numba kernel runs channels in parallel.
+    """
+    num_samples = data.shape[1]
+    padlen = min(3 * (2 * len(sos) + 1), num_samples - 1)
+    if padlen < 1:
+        return data
+    if NUMBA_AVAILABLE:
+        try:
+            return _sosfiltfilt_numba(sos, zi, data, padlen)
+        except Exception as e:
+            _disable_numba(e)
+
+    from scipy.signal import sosfiltfilt as scipy_sosfiltfilt
+    return scipy_sosfiltfilt(sos, data, axis=-1, padlen=padlen)
+
+
+def _sosfiltfilt_numba(sos: np.ndarray, zi: np.ndarray, data: np.ndarray, padlen: int) -> np.ndarray:
+    """Odd-extend each row by padlen, then run the SOS kernel forward and backward."""
+    num_samples = data.shape[1]
+    data = np.asarray(data, dtype=np.float64)
+    left = 2 * data[:, :1] - data[:, padlen:0:-1]
+    right = 2 * data[:, -1:] - data[:, -2:-padlen - 2:-1]
+    extended = np.ascontiguousarray(np.concatenate((left, data, right), axis=1))
+
+    forward = np.empty_like(extended)
+    _sosfilt_batch(sos, zi, extended, forward)
+    reversed_forward = np.ascontiguousarray(forward[:, ::-1])
+    backward = np.empty_like(reversed_forward)
+    _sosfilt_batch(sos, zi, reversed_forward, backward)
+    return backward[:, ::-1][:, padlen:padlen + num_samples]
@@ -5,11 +5,18 @@ Parses voice commands to create annotations.
 import re
 from typing import Optional, Dict, Any
 
+# "<label> from <start> to <end>" is matched in two linear steps instead of one pattern with a
+# lazy label group, which rescans the rest of the line from every start position when no
+# match exists: locate each standalone "from", then match the times right after it
+_FROM_PATTERN = re.compile(r'\sfrom(?=\s)', re.IGNORECASE)
+_TIMES_PATTERN = re.compile(r'\s+([\d.]+)\s+to\s+([\d.]+)', re.IGNORECASE)
+
 class VoiceAnnotationParser:
     """Parses a string of text to extract annotation details."""
 
     def __init__(self, text: str):
-        self.text = text.lower()
+        # Matching is case-insensitive, so only the extracted label is lower-cased
+        self.text = text
         self.label: Optional[str] = None
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
@@ -21,14 +28,22 @@ class VoiceAnnotationParser:
         Returns:
             A dictionary with 'label', 'start_time', and 'end_time', or None if parsing fails.
         """
-        # Regex to capture "<label> from <start> to <end>"
-        match = re.search(r'(.+?)\s+from\s+([\d\.]+)\s+to\s+([\d\.]+)', self.text)
+        text = self.text
+        for from_match in _FROM_PATTERN.finditer(text):
+            times = _TIMES_PATTERN.match(text, from_match.end())
+            if times is None:
+                continue
+            # "from" needs something on its line before the whitespace that precedes it;
+            # the label is that line up to the last non-blank character
+            prefix = text[:from_match.start()]
+            if not prefix.strip('\n'):
+                continue
+            label = prefix.rstrip().rpartition('\n')[2].strip().lower()
 
-        if match:
-            self.label = match.group(1).strip()
+            self.label = label
             try:
-                self.start_time = float(match.group(2))
-                self.end_time = float(match.group(3))
+                self.start_time = float(times.group(1))
+                self.end_time = float(times.group(2))
             except ValueError:
                 return None
 